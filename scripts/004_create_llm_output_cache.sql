@@ -0,0 +1,16 @@
+-- =============================================================================
+-- LLM Output Cache
+-- =============================================================================
+-- This migration adds a cache for generated resumes and cover letters, so
+-- repeated jobs (same profile, title, company, description and keywords)
+-- reuse the earlier LLM output instead of paying for a new completion.
+
+CREATE TABLE IF NOT EXISTS llm_output_cache (
+    -- SHA-256 over the generation inputs (see generator/llm.py)
+    cache_key CHAR(64) PRIMARY KEY,
+    content TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Add comment
+COMMENT ON TABLE llm_output_cache IS 'Generated resume/cover letter text keyed by a hash of the prompt inputs';
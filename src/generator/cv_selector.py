@@ -2,11 +2,16 @@
 CV Selector - Chooses the best CV variant based on job requirements.
 """
 
+import sys
+from collections import defaultdict
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 from loguru import logger
 
+from generator.keywords import KeywordMatcher
+
 
 # CV variants and their matching keywords
 CV_VARIANTS = {
@@ -52,6 +57,35 @@ CV_VARIANTS = {
 }
 
 
+# Freeze the variants: read-only mappings with interned keyword tuples
+CV_VARIANTS = MappingProxyType({
+    name: MappingProxyType({
+        "path": config["path"],
+        "keywords": tuple(sys.intern(keyword) for keyword in config["keywords"]),
+        "weight": config["weight"],
+    })
+    for name, config in CV_VARIANTS.items()
+})
+_PATH_BY_VARIANT = {name: config["path"] for name, config in CV_VARIANTS.items()}
+
+# Lowercased keywords per variant, computed once instead of per job
+_VARIANT_KEYWORDS_LOWER = MappingProxyType({
+    name: tuple(sys.intern(keyword.lower()) for keyword in config["keywords"])
+    for name, config in CV_VARIANTS.items()
+})
+
+# Single matcher over all variants' keywords, keyword -> [(variant, keyword)]
+_KEYWORD_MATCHER = KeywordMatcher(
+    keyword for keywords in _VARIANT_KEYWORDS_LOWER.values() for keyword in keywords
+)
+_KEYWORD_OWNERS: dict[str, list[tuple[str, str]]] = defaultdict(list)
+for _variant_name, _variant_config in CV_VARIANTS.items():
+    for _keyword, _keyword_lower in zip(
+        _variant_config["keywords"], _VARIANT_KEYWORDS_LOWER[_variant_name]
+    ):
+        _KEYWORD_OWNERS[_keyword_lower].append((_variant_name, _keyword))
+
+
 def select_best_cv(
     job_title: str,
     job_description: str,
@@ -68,31 +102,39 @@ def select_best_cv(
     Returns:
         Tuple of (cv_path, cv_variant_name)
     """
-    # Combine title and description for matching
-    text = f"{job_title} {job_description}".lower()
+    # Combine title and description for matching; "\x00" keeps keywords from
+    # spanning both, so a match ending within the title is a title match
+    title_lower = job_title.lower()
+    text = f"{title_lower}\x00{job_description.lower()}"
+    title_end = len(title_lower)
+
+    # Single scan over the text collects every keyword occurrence
+    found: dict[str, bool] = {}
+    for keyword, end in _KEYWORD_MATCHER.iter_matches(text):
+        found[keyword] = found.get(keyword, False) or end <= title_end
+
+    raw_scores: dict[str, int] = defaultdict(int)
+    matched_keywords: dict[str, list[str]] = defaultdict(list)
+    for keyword_lower, in_title in found.items():
+        for variant_name, keyword in _KEYWORD_OWNERS[keyword_lower]:
+            # Title matches worth more
+            raw_scores[variant_name] += 3 if in_title else 1
+            matched_keywords[variant_name].append(keyword)
 
     scores = {}
-
     for variant_name, variant_config in CV_VARIANTS.items():
-        score = 0
-        matched_keywords = []
-
-        for keyword in variant_config["keywords"]:
-            if keyword.lower() in text:
-                # Title matches worth more
-                if keyword.lower() in job_title.lower():
-                    score += 3
-                else:
-                    score += 1
-                matched_keywords.append(keyword)
-
         # Apply weight
-        score *= variant_config["weight"]
-        scores[variant_name] = (score, matched_keywords)
-
-        logger.debug(
-            f"CV '{variant_name}' score: {score} "
-            f"(matched: {matched_keywords[:5]}{'...' if len(matched_keywords) > 5 else ''})"
+        score = raw_scores[variant_name] * variant_config["weight"]
+        variant_keywords = matched_keywords[variant_name]
+        scores[variant_name] = (score, variant_keywords)
+
+        # Lazy: the keyword preview is only built when debug logging is enabled
+        logger.opt(lazy=True).debug(
+            "CV '{}' score: {} (matched: {}{})",
+            lambda: variant_name,
+            lambda: score,
+            lambda: variant_keywords[:5],
+            lambda: "..." if len(variant_keywords) > 5 else "",
         )
 
     # Select the variant with highest score
@@ -109,14 +151,11 @@ def select_best_cv(
             f"keywords: {best_keywords[:3]}...)"
         )
 
-    cv_path = cv_dir / CV_VARIANTS[best_variant]["path"]
+    cv_path = cv_dir / _PATH_BY_VARIANT[best_variant]
 
     return cv_path, best_variant
 
 
 def get_all_cv_paths(cv_dir: Path) -> dict[str, Path]:
     """Get all available CV paths."""
-    return {
-        name: cv_dir / config["path"]
-        for name, config in CV_VARIANTS.items()
-    }
+    return {name: cv_dir / path for name, path in _PATH_BY_VARIANT.items()}
@@ -3,9 +3,19 @@ CV Tailoring using LLM.
 Uses OpenAI to customize CV content for specific job descriptions.
 """
 
-import copy
+import asyncio
+import concurrent.futures
+import hashlib
 import json
+import math
+import os
+import pickle
+import re
+from collections import OrderedDict
+from collections.abc import Collection
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional
 
@@ -13,7 +23,147 @@ import yaml
 from loguru import logger
 from openai import AsyncOpenAI
 
+from generator.keywords import KeywordMatcher, SemanticKeywordScorer
 from shared.config import Settings, get_settings
+from shared.openai_client import get_openai_client
+
+# Use libyaml's C loader when available
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Use orjson's C parser when available; its JSONDecodeError subclasses json's
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+
+def _language_pattern(words: list[str]) -> re.Pattern:
+    """Match any of the words as a whole space-delimited token."""
+    return re.compile(r"(?<![^ ])(?:" + "|".join(map(re.escape, words)) + r")(?![^ ])")
+
+
+# Language indicator words for job posting language detection
+_GERMAN_RE = _language_pattern(["und", "der", "die", "das", "für", "mit", "wir", "sie", "sind", "haben", "werden", "ihre", "unser", "arbeit", "erfahrung", "kenntnisse", "aufgaben", "anforderungen"])
+_FRENCH_RE = _language_pattern(["et", "le", "la", "les", "pour", "avec", "nous", "vous", "sont", "avoir", "être", "notre", "votre", "travail", "expérience", "compétences", "missions", "profil"])
+_ITALIAN_RE = _language_pattern(["e", "il", "la", "per", "con", "noi", "loro", "sono", "avere", "essere", "nostro", "lavoro", "esperienza", "competenze", "requisiti"])
+
+
+# Job description token budgets per prompt
+ATS_PROMPT_TOKENS = 1500
+SUMMARY_PROMPT_TOKENS = 1200
+COVER_LETTER_PROMPT_TOKENS = 1800
+
+# Rough characters-per-token ratio when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=1)
+def _token_encoding() -> Any:
+    """Load the tokenizer once; None if tiktoken or its encoding file is unavailable."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.debug(f"tiktoken unavailable, truncating by characters: {e}")
+        return None
+
+
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """Truncate text to at most max_tokens tokens."""
+    # Every token covers at least one character
+    if len(text) <= max_tokens:
+        return text
+    encoding = _token_encoding()
+    if encoding is None:
+        return text[: max_tokens * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text)
+    return encoding.decode(tokens[:max_tokens]) if len(tokens) > max_tokens else text
+
+
+# Markdown code fences around LLM JSON output, and the outermost JSON array
+_FENCE_RE = re.compile(r"^```[^\n]*\n?|\n?```\s*$")
+_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+
+
+def _write_cache(cache_path: Path, obj: Any) -> None:
+    """Atomically pickle obj to cache_path. Best effort: the CV directory may be read-only."""
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write cache {cache_path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=8)
+def _load_cv_cached(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    """
+    Parse a CV YAML once per process and modification time.
+    Keeps a pickle sidecar next to the YAML so later processes skip parsing.
+    Callers must not mutate the result; see _clone_for_mutation.
+    """
+    cv_path = Path(path_str)
+    cache_path = cv_path.with_suffix(cv_path.suffix + ".pkl")
+    try:
+        if cache_path.stat().st_mtime_ns >= mtime_ns:
+            return pickle.loads(cache_path.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    with open(cv_path, "rb") as f:
+        cv = yaml.load(f, Loader=YamlLoader)
+
+    _write_cache(cache_path, cv)
+    return cv
+
+
+# Reordered CVs by (CV path, CV mtime, ATS keywords), least recently used first
+REORDERED_CV_CACHE_SIZE = 256
+_REORDERED_CV_CACHE: OrderedDict[tuple[str, int, tuple[str, ...]], dict[str, Any]] = OrderedDict()
+
+
+def _clone_for_mutation(cv: dict[str, Any]) -> dict[str, Any]:
+    """
+    Copy only the parts of the CV that tailoring mutates.
+    Other sections (education, certifications, ...) stay shared with the cached base CV.
+    """
+    out = dict(cv)
+    cv_content = out["cv"] = dict(cv.get("cv", {}))
+    sections = cv_content["sections"] = dict(cv_content.get("sections", {}))
+    if "experience" in sections:
+        sections["experience"] = [
+            dict(exp, highlights=list(exp["highlights"])) if "highlights" in exp else dict(exp)
+            for exp in sections["experience"]
+        ]
+    if "skills" in sections:
+        sections["skills"] = [dict(skill) for skill in sections["skills"]]
+    if "summary" in sections:
+        sections["summary"] = list(sections["summary"])
+    return out
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    """Scale a vector to unit length so dot products are cosine similarities."""
+    norm = math.hypot(*vector)
+    return [v / norm for v in vector] if norm else vector
+
+
+@lru_cache(maxsize=1)
+def _cpu_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """Worker processes for CV reordering, started on first use."""
+    return concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+def _reorder_cv_in_worker(
+    base_cv_path: Path,
+    settings: Settings,
+    ats_keywords: list[str],
+    scorer: Optional[SemanticKeywordScorer],
+) -> dict[str, Any]:
+    """Build the reordered CV in a worker process; workers keep their own CV caches."""
+    return CVTailor(base_cv_path, settings)._build_reordered_cv(ats_keywords, scorer)
 
 
 @dataclass
@@ -38,48 +188,129 @@ class CVTailor:
         self.base_cv_path = base_cv_path
         self._client: Optional[AsyncOpenAI] = None
         self._base_cv: Optional[dict] = None
+        self._base_cv_mtime_ns = 0
+        self._embedding_cache: Optional[dict[str, list[float]]] = None
 
     @property
     def client(self) -> AsyncOpenAI:
-        """Get or create OpenAI client."""
+        """Get the shared OpenAI client."""
         if self._client is None:
-            self._client = AsyncOpenAI(
-                api_key=self.settings.openai_api_key.get_secret_value()
-            )
+            self._client = get_openai_client(self.settings.openai_api_key.get_secret_value())
         return self._client
 
     def load_base_cv(self) -> dict[str, Any]:
-        """Load base CV from YAML file."""
+        """
+        Load base CV from YAML file.
+        The parsed CV is shared read-only by every tailor in the process.
+        """
         if self._base_cv is None:
-            with open(self.base_cv_path, "r") as f:
-                self._base_cv = yaml.safe_load(f)
+            self._base_cv_mtime_ns = self.base_cv_path.stat().st_mtime_ns
+            self._base_cv = _load_cv_cached(str(self.base_cv_path), self._base_cv_mtime_ns)
         return self._base_cv
 
+    def _cv_match_texts(self) -> list[str]:
+        """Collect the base CV texts that keyword relevance is scored against."""
+        sections = self.load_base_cv().get("cv", {}).get("sections", {})
+        texts = []
+        for exp in sections.get("experience", []):
+            texts.extend(str(h) for h in exp.get("highlights", []))
+            if exp.get("position"):
+                texts.append(exp["position"])
+        for section in ("skills", "certifications"):
+            for item in sections.get(section, []):
+                texts.extend(
+                    item[key] for key in ("label", "details") if isinstance(item.get(key), str)
+                )
+        return list(dict.fromkeys(t for t in texts if t))
+
+    async def _embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts in a single API call, returning unit-length vectors."""
+        response = await self.client.embeddings.create(
+            model=self.settings.generator_embedding_model,
+            input=texts,
+        )
+        return [_normalize(item.embedding) for item in response.data]
+
+    async def _embed_cv_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed CV texts, reusing vectors cached on disk by text hash."""
+        cache_path = self.base_cv_path.with_suffix(self.base_cv_path.suffix + ".embeddings.pkl")
+        if self._embedding_cache is None:
+            try:
+                self._embedding_cache = pickle.loads(cache_path.read_bytes())
+            except (OSError, pickle.UnpicklingError, EOFError):
+                self._embedding_cache = {}
+
+        model = self.settings.generator_embedding_model
+        keys = [hashlib.sha256(f"{model}\0{text}".encode()).hexdigest() for text in texts]
+        missing = [(key, text) for key, text in zip(keys, texts) if key not in self._embedding_cache]
+        if missing:
+            vectors = await self._embed([text for _, text in missing])
+            self._embedding_cache.update(zip((key for key, _ in missing), vectors))
+            _write_cache(cache_path, self._embedding_cache)
+
+        return [self._embedding_cache[key] for key in keys]
+
+    async def _build_semantic_scorer(
+        self, ats_keywords: list[str]
+    ) -> Optional[SemanticKeywordScorer]:
+        """
+        Match ATS keywords to CV texts by embedding similarity.
+        Returns None when semantic matching is disabled or fails.
+        """
+        if not self.settings.generator_semantic_matching or not ats_keywords:
+            return None
+
+        matcher = KeywordMatcher(ats_keywords)
+        keywords = list(matcher.multiplicity)
+        texts = self._cv_match_texts()
+        try:
+            keyword_vectors, text_vectors = await asyncio.gather(
+                self._embed(keywords), self._embed_cv_texts(texts)
+            )
+        except Exception as e:
+            logger.warning(f"Semantic keyword matching failed, using substring matching: {e}")
+            return None
+
+        threshold = self.settings.generator_semantic_threshold
+        semantic_hits = {
+            text: {
+                kw for kw, kw_vector in zip(keywords, keyword_vectors)
+                if math.sumprod(kw_vector, text_vector) >= threshold
+            }
+            for text, text_vector in zip(texts, text_vectors)
+        }
+        return SemanticKeywordScorer(matcher, semantic_hits)
+
     def _extract_json_array(self, text: str) -> list[str]:
         """Extract JSON array from text, handling markdown code blocks."""
         if not text:
             return []
 
-        # Remove markdown code blocks if present
+        # Fast path: the prompt asks for a bare JSON array
         text = text.strip()
-        if text.startswith("```"):
-            # Remove opening ```json or ```
-            lines = text.split("\n")
-            if lines[0].startswith("```"):
-                lines = lines[1:]
-            # Remove closing ```
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            text = "\n".join(lines).strip()
+        try:
+            result = json_loads(text)
+            if isinstance(result, list):
+                return result
+        except json.JSONDecodeError:
+            pass
+
+        # Remove markdown code fences if present
+        text = _FENCE_RE.sub("", text).strip()
 
         # Try to find JSON array in the text
-        import re
-        # Look for array pattern
-        match = re.search(r'\[.*\]', text, re.DOTALL)
+        match = _ARRAY_RE.search(text)
         if match:
             text = match.group(0)
 
-        return json.loads(text)
+        return json_loads(text)
+
+    def _extract_str_array(self, text: str) -> list[str]:
+        """Extract a JSON array of strings from text. Raises ValueError for any other shape."""
+        result = self._extract_json_array(text)
+        if not isinstance(result, list) or not all(isinstance(item, str) for item in result):
+            raise ValueError(f"expected a JSON array of strings, got {type(result).__name__}")
+        return result
 
     async def extract_ats_keywords(
         self,
@@ -100,7 +331,7 @@ class CVTailor:
 Job Title: {job_title}
 
 Job Description:
-{job_description[:4000]}
+{_truncate_tokens(job_description, ATS_PROMPT_TOKENS)}
 
 IMPORTANT RULES:
 1. Output all keywords in ENGLISH (translate if needed)
@@ -112,6 +343,7 @@ IMPORTANT RULES:
 
 Output ONLY a JSON array of keywords, nothing else. Example: ["ISO 27001", "NIST 800-53", "SIEM", "Incident Response", "Risk Assessment", "Azure", "Leadership"]"""
 
+        content: Optional[str] = None
         try:
             response = await self.client.chat.completions.create(
                 model=self.settings.openai_model_mini,
@@ -131,104 +363,115 @@ Output ONLY a JSON array of keywords, nothing else. Example: ["ISO 27001", "NIST
                 logger.warning("Empty response from OpenAI for ATS keywords")
                 return []
 
-            # Parse JSON array (handles markdown code blocks)
-            keywords = self._extract_json_array(content.strip())
-
-            if not isinstance(keywords, list):
-                logger.warning(f"ATS keywords response is not a list: {type(keywords)}")
-                return []
+            # Parse JSON array of strings (handles markdown code blocks)
+            keywords = self._extract_str_array(content)
 
             logger.info(f"Extracted {len(keywords)} ATS keywords: {keywords[:5]}...")
             return keywords
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"Failed to parse ATS keywords JSON: {e}. Raw content: {content[:200] if content else 'None'}")
             return []
         except Exception as e:
             logger.error(f"Failed to extract ATS keywords: {e}")
             return []
 
-    def _score_text_relevance(self, text: str, keywords: list[str]) -> int:
+    def _score_text_relevance(
+        self, text: str, matcher: KeywordMatcher | SemanticKeywordScorer
+    ) -> int:
         """Score how many keywords appear in the text (case-insensitive)."""
-        if not text or not keywords:
-            return 0
-        text_lower = text.lower()
-        return sum(1 for kw in keywords if kw.lower() in text_lower)
+        return matcher.count(text)
 
     def _reorder_by_relevance(
-        self, items: list[dict], keywords: list[str], text_key: str = "highlights"
+        self,
+        items: list[dict],
+        matcher: KeywordMatcher | SemanticKeywordScorer,
+        text_key: str = "highlights",
     ) -> list[dict]:
         """Reorder items by keyword relevance."""
-        if not items or not keywords:
+        if not items or not matcher:
             return items
 
-        def get_score(item: dict) -> int:
+        # Score every item in one pass; each field is scored on its own so a
+        # keyword counts once per field, position/label weighted double
+        count = matcher.count
+        scored = []
+        for item in items:
             score = 0
-            # Score from highlights/details
             if text_key in item:
-                if isinstance(item[text_key], list):
-                    for h in item[text_key]:
-                        score += self._score_text_relevance(str(h), keywords)
+                value = item[text_key]
+                if isinstance(value, list):
+                    score += sum(count(str(h)) for h in value)
                 else:
-                    score += self._score_text_relevance(str(item[text_key]), keywords)
-            # Score from position/label
+                    score += count(str(value))
             if "position" in item:
-                score += self._score_text_relevance(item["position"], keywords) * 2
+                score += count(item["position"]) * 2
             if "label" in item:
-                score += self._score_text_relevance(item["label"], keywords) * 2
+                score += count(item["label"]) * 2
             if "details" in item and isinstance(item["details"], str):
-                score += self._score_text_relevance(item["details"], keywords)
-            return score
+                score += count(item["details"])
+            scored.append((score, item))
 
-        return sorted(items, key=get_score, reverse=True)
+        scored.sort(key=itemgetter(0), reverse=True)
+        return [item for _, item in scored]
 
-    def _reorder_highlights(self, highlights: list[str], keywords: list[str]) -> list[str]:
+    def _reorder_highlights(
+        self, highlights: list[str], matcher: KeywordMatcher | SemanticKeywordScorer
+    ) -> list[str]:
         """Reorder highlights to put keyword-matching ones first."""
-        if not highlights or not keywords:
+        if not highlights or not matcher:
             return highlights
 
-        scored = [(h, self._score_text_relevance(h, keywords)) for h in highlights]
+        scored = [(h, self._score_text_relevance(h, matcher)) for h in highlights]
         scored.sort(key=lambda x: x[1], reverse=True)
         return [h for h, _ in scored]
 
     def _create_key_skills_section(
-        self, ats_keywords: list[str], cv_sections: dict
+        self,
+        ats_keywords: list[str],
+        cv_sections: dict,
+        semantic_keywords: Collection[str] = (),
     ) -> list[dict]:
         """Create a Key Skills section with matching ATS keywords.
 
         Checks skills, certifications, and experience highlights for matches.
+        Keywords in semantic_keywords (lowercased) count as matches as well.
         """
         # Collect all text from skills, certifications, and experience
-        all_text = ""
-        all_terms = []
+        text_parts = []
+        all_terms = set()
 
         # From skills section
         for skill in cv_sections.get("skills", []):
             if "details" in skill:
-                all_text += " " + skill["details"].lower()
+                text_parts.append(skill["details"])
                 for term in skill["details"].replace("(", ",").replace(")", ",").split(","):
                     term = term.strip()
                     if len(term) > 2:
-                        all_terms.append(term.lower())
+                        all_terms.add(term.lower())
             if "label" in skill:
-                all_text += " " + skill["label"].lower()
-                all_terms.append(skill["label"].lower())
+                text_parts.append(skill["label"])
+                all_terms.add(skill["label"].lower())
 
         # From certifications section
         for cert in cv_sections.get("certifications", []):
             if "label" in cert:
-                all_text += " " + cert["label"].lower()
+                text_parts.append(cert["label"])
                 # Extract acronyms like CISM, CRISC, CEH
                 for word in cert["label"].split():
                     if word.isupper() and len(word) >= 2:
-                        all_terms.append(word.lower())
+                        all_terms.add(word.lower())
                     elif word.startswith("(") and word.endswith(")"):
-                        all_terms.append(word[1:-1].lower())
+                        all_terms.add(word[1:-1].lower())
 
         # From experience highlights (key technical terms)
         for exp in cv_sections.get("experience", []):
-            for highlight in exp.get("highlights", []):
-                all_text += " " + highlight.lower()
+            text_parts.extend(exp.get("highlights", []))
+
+        all_text = " ".join(["", *text_parts]).lower()
+        # Every term is taken from text already in all_text, so only the
+        # "term inside keyword" direction can add matches below
+        short_terms = [term for term in all_terms if len(term) > 2]
 
         # Find ATS keywords that match candidate's profile
         matching_keywords = []
@@ -237,8 +480,11 @@ Output ONLY a JSON array of keywords, nothing else. Example: ["ISO 27001", "NIST
             # Check if keyword exists in all text
             if kw_lower in all_text:
                 matching_keywords.append(kw)
-            # Check if keyword matches any specific term
-            elif any(kw_lower == term or kw_lower in term or term in kw_lower for term in all_terms if len(term) > 2):
+            # Check if a specific term is part of the keyword
+            elif any(term in kw_lower for term in short_terms if len(term) <= len(kw_lower)):
+                matching_keywords.append(kw)
+            # Check if keyword is semantically close to the candidate's CV text
+            elif kw_lower in semantic_keywords:
                 matching_keywords.append(kw)
 
         if not matching_keywords:
@@ -247,24 +493,66 @@ Output ONLY a JSON array of keywords, nothing else. Example: ["ISO 27001", "NIST
         # Return as a single entry with comma-separated skills
         return [{"label": "Key Skills", "details": ", ".join(matching_keywords[:12])}]
 
-    async def tailor_cv(
+    def _build_reordered_cv(
         self,
-        job_title: str,
-        company: str,
-        job_description: str,
         ats_keywords: list[str],
+        scorer: Optional[SemanticKeywordScorer] = None,
     ) -> dict[str, Any]:
         """
-        Tailor CV content for a specific job.
-        - Rewrites summary with ATS keywords
+        Build a copy of the base CV reordered for the ATS keywords (CPU only).
+        Reuses an earlier build for the same CV file and keyword list; semantic
+        scores depend on the job, so those builds are not cached.
+        """
+        if scorer is not None:
+            return self._reorder_base_cv(ats_keywords, scorer)
+
+        self.load_base_cv()
+        key = (str(self.base_cv_path), self._base_cv_mtime_ns, tuple(ats_keywords))
+        reordered = _REORDERED_CV_CACHE.get(key)
+        if reordered is None:
+            reordered = _REORDERED_CV_CACHE[key] = self._reorder_base_cv(ats_keywords)
+            if len(_REORDERED_CV_CACHE) > REORDERED_CV_CACHE_SIZE:
+                _REORDERED_CV_CACHE.popitem(last=False)
+        else:
+            _REORDERED_CV_CACHE.move_to_end(key)
+            logger.debug(f"Reusing reordered CV for {len(ats_keywords)} ATS keywords")
+
+        # The cached build is shared; callers still rewrite the summary
+        return _clone_for_mutation(reordered)
+
+    async def _reorder_cv(
+        self,
+        ats_keywords: list[str],
+        scorer: Optional[SemanticKeywordScorer] = None,
+    ) -> dict[str, Any]:
+        """Build the reordered CV, in a worker process if the process pool is enabled."""
+        if not self.settings.generator_process_pool:
+            return self._build_reordered_cv(ats_keywords, scorer)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _cpu_pool(), _reorder_cv_in_worker, self.base_cv_path, self.settings, ats_keywords, scorer
+        )
+
+    def _reorder_base_cv(
+        self,
+        ats_keywords: list[str],
+        scorer: Optional[SemanticKeywordScorer] = None,
+    ) -> dict[str, Any]:
+        """
+        Reorder a copy of the base CV for the ATS keywords.
         - Reorders experience highlights by relevance
         - Reorders skills by relevance
         - Adds Key Skills section with matching ATS keywords
+        Uses the semantic scorer for relevance when one is given.
         """
-        base_cv = copy.deepcopy(self.load_base_cv())
+        base_cv = _clone_for_mutation(self.load_base_cv())
         cv_content = base_cv.get("cv", {})
         sections = cv_content.get("sections", {})
 
+        # Compile the ATS keywords once for all relevance scoring below
+        matcher = scorer or KeywordMatcher(ats_keywords)
+
         # =====================================================================
         # 1. Reorder experience highlights by keyword relevance
         # =====================================================================
@@ -272,11 +560,11 @@ Output ONLY a JSON array of keywords, nothing else. Example: ["ISO 27001", "NIST
         for exp in experience:
             if "highlights" in exp:
                 exp["highlights"] = self._reorder_highlights(
-                    exp["highlights"], ats_keywords
+                    exp["highlights"], matcher
                 )
         # Also reorder experiences themselves (most relevant job first)
         sections["experience"] = self._reorder_by_relevance(
-            experience, ats_keywords, "highlights"
+            experience, matcher, "highlights"
         )
         logger.debug(f"Reordered {len(experience)} experience entries by relevance")
 
@@ -284,13 +572,15 @@ Output ONLY a JSON array of keywords, nothing else. Example: ["ISO 27001", "NIST
         # 2. Reorder skills by keyword relevance
         # =====================================================================
         skills = sections.get("skills", [])
-        sections["skills"] = self._reorder_by_relevance(skills, ats_keywords, "details")
+        sections["skills"] = self._reorder_by_relevance(skills, matcher, "details")
         logger.debug(f"Reordered {len(skills)} skill entries by relevance")
 
         # =====================================================================
         # 3. Create Key Skills section from matching ATS keywords
         # =====================================================================
-        key_skills = self._create_key_skills_section(ats_keywords, sections)
+        key_skills = self._create_key_skills_section(
+            ats_keywords, sections, scorer.matched_keywords if scorer else ()
+        )
         if key_skills:
             # Insert key_skills right after summary
             new_sections = {}
@@ -299,11 +589,23 @@ Output ONLY a JSON array of keywords, nothing else. Example: ["ISO 27001", "NIST
                 if key == "summary":
                     new_sections["key_skills"] = key_skills
             sections = new_sections
-            logger.debug(f"Added Key Skills section with {len(key_skills[0]['details'].split(', '))} skills")
+            logger.opt(lazy=True).debug(
+                "Added Key Skills section with {} skills",
+                lambda: len(key_skills[0]["details"].split(", ")),
+            )
 
-        # =====================================================================
-        # 4. Tailor summary using LLM
-        # =====================================================================
+        base_cv["cv"]["sections"] = sections
+        return base_cv
+
+    async def _rewrite_summary(
+        self,
+        job_title: str,
+        company: str,
+        job_description: str,
+        ats_keywords: list[str],
+        sections: dict[str, Any],
+    ) -> Optional[str]:
+        """Rewrite the CV summary for the job using LLM. Returns None on failure."""
         current_summary = sections.get("summary", [""])[0] if sections.get("summary") else ""
 
         # Get experience highlights for context
@@ -318,7 +620,7 @@ Output ONLY a JSON array of keywords, nothing else. Example: ["ISO 27001", "NIST
 Target Job: {job_title} at {company}
 
 Job Description:
-{job_description[:3000]}
+{_truncate_tokens(job_description, SUMMARY_PROMPT_TOKENS)}
 
 ATS Keywords to incorporate naturally: {', '.join(ats_keywords[:15])}
 
@@ -355,46 +657,60 @@ Output ONLY the new summary text, nothing else."""
             # Remove quotes if present
             if new_summary.startswith('"') and new_summary.endswith('"'):
                 new_summary = new_summary[1:-1]
-
-            # Update the CV with tailored summary
-            sections["summary"] = [new_summary]
-            base_cv["cv"]["sections"] = sections
-
-            logger.info(f"Tailored CV for {job_title} at {company} (summary + reordering + key skills)")
-            return base_cv
+            return new_summary
 
         except Exception as e:
             logger.error(f"Failed to tailor CV: {e}")
-            # Still return CV with reordered sections even if summary fails
-            base_cv["cv"]["sections"] = sections
-            return base_cv
+            return None
+
+    async def tailor_cv(
+        self,
+        job_title: str,
+        company: str,
+        job_description: str,
+        ats_keywords: list[str],
+    ) -> dict[str, Any]:
+        """
+        Tailor CV content for a specific job.
+        - Rewrites summary with ATS keywords
+        - Reorders experience highlights by relevance
+        - Reorders skills by relevance
+        - Adds Key Skills section with matching ATS keywords
+        """
+        scorer = await self._build_semantic_scorer(ats_keywords)
+        tailored_cv = await self._reorder_cv(ats_keywords, scorer)
+        new_summary = await self._rewrite_summary(
+            job_title, company, job_description, ats_keywords, tailored_cv["cv"]["sections"]
+        )
+        return self._apply_summary(tailored_cv, new_summary, job_title, company)
 
-    async def _detect_language(self, text: str) -> tuple[str, str]:
+    def _apply_summary(
+        self,
+        tailored_cv: dict[str, Any],
+        new_summary: Optional[str],
+        job_title: str,
+        company: str,
+    ) -> dict[str, Any]:
+        """Put the rewritten summary into the reordered CV, if the rewrite succeeded."""
+        # Still return CV with reordered sections even if summary fails
+        if new_summary is not None:
+            tailored_cv["cv"]["sections"]["summary"] = [new_summary]
+            logger.info(f"Tailored CV for {job_title} at {company} (summary + reordering + key skills)")
+        return tailored_cv
+
+    def _detect_language(self, text: str) -> tuple[str, str]:
         """
         Detect the language of the text.
         Returns (language_code, language_name) e.g., ("de", "German")
         """
-        # Quick heuristic detection based on common words
+        # Quick heuristic detection based on common words (distinct words found);
+        # languages are checked in priority order so later scans are skipped once one matches
         text_lower = text.lower()
-
-        # German indicators
-        german_words = ["und", "der", "die", "das", "für", "mit", "wir", "sie", "sind", "haben", "werden", "ihre", "unser", "arbeit", "erfahrung", "kenntnisse", "aufgaben", "anforderungen"]
-        german_count = sum(1 for word in german_words if f" {word} " in f" {text_lower} ")
-
-        # French indicators
-        french_words = ["et", "le", "la", "les", "pour", "avec", "nous", "vous", "sont", "avoir", "être", "notre", "votre", "travail", "expérience", "compétences", "missions", "profil"]
-        french_count = sum(1 for word in french_words if f" {word} " in f" {text_lower} ")
-
-        # Italian indicators
-        italian_words = ["e", "il", "la", "per", "con", "noi", "loro", "sono", "avere", "essere", "nostro", "lavoro", "esperienza", "competenze", "requisiti"]
-        italian_count = sum(1 for word in italian_words if f" {word} " in f" {text_lower} ")
-
-        # Determine language
-        if german_count >= 5:
+        if len(set(_GERMAN_RE.findall(text_lower))) >= 5:
             return ("de", "German")
-        elif french_count >= 5:
+        elif len(set(_FRENCH_RE.findall(text_lower))) >= 5:
             return ("fr", "French")
-        elif italian_count >= 4:
+        elif len(set(_ITALIAN_RE.findall(text_lower))) >= 4:
             return ("it", "Italian")
         else:
             return ("en", "English")
@@ -418,7 +734,7 @@ Output ONLY the new summary text, nothing else."""
         sections = cv_content.get("sections", {})
 
         # Detect job posting language
-        lang_code, lang_name = await self._detect_language(job_description)
+        lang_code, lang_name = self._detect_language(job_description)
         language_note = ""
         if lang_code != "en":
             language_note = f"""
@@ -446,7 +762,7 @@ Company: {company}
 Location: {location}
 
 Job Description:
-{job_description}
+{_truncate_tokens(job_description, COVER_LETTER_PROMPT_TOKENS)}
 
 Candidate Name: {name}
 
@@ -506,24 +822,32 @@ Output ONLY the cover letter text, nothing else."""
             logger.debug(f"Extracting ATS keywords for {job_title}")
             ats_keywords = await self.extract_ats_keywords(job_title, job_description)
 
-            # Step 2: Tailor CV
+            # Step 2: Reorder CV sections (no LLM call; embeddings only if enabled)
             logger.debug(f"Tailoring CV for {job_title}")
-            tailored_cv = await self.tailor_cv(
-                job_title=job_title,
-                company=company,
-                job_description=job_description,
-                ats_keywords=ats_keywords,
-            )
-
-            # Step 3: Generate cover letter
-            logger.debug(f"Generating cover letter for {job_title}")
-            cover_letter = await self.generate_cover_letter(
-                job_title=job_title,
-                company=company,
-                location=location,
-                job_description=job_description,
-                ats_keywords=ats_keywords,
+            scorer = await self._build_semantic_scorer(ats_keywords)
+            tailored_cv = await self._reorder_cv(ats_keywords, scorer)
+
+            # Step 3: Rewrite summary and generate cover letter concurrently.
+            # The cover letter is built from the base CV summary, so it does
+            # not depend on the rewritten one.
+            logger.debug(f"Rewriting summary and generating cover letter for {job_title}")
+            new_summary, cover_letter = await asyncio.gather(
+                self._rewrite_summary(
+                    job_title=job_title,
+                    company=company,
+                    job_description=job_description,
+                    ats_keywords=ats_keywords,
+                    sections=tailored_cv["cv"]["sections"],
+                ),
+                self.generate_cover_letter(
+                    job_title=job_title,
+                    company=company,
+                    location=location,
+                    job_description=job_description,
+                    ats_keywords=ats_keywords,
+                ),
             )
+            tailored_cv = self._apply_summary(tailored_cv, new_summary, job_title, company)
 
             return TailoringResult(
                 success=True,
@@ -541,3 +865,36 @@ Output ONLY the cover letter text, nothing else."""
                 ats_keywords=[],
                 error=str(e),
             )
+
+    @classmethod
+    async def tailor_batch(
+        cls,
+        jobs: list[dict[str, str]],
+        base_cv_path: Path,
+        concurrency: Optional[int] = None,
+        settings: Optional[Settings] = None,
+    ) -> list[TailoringResult]:
+        """
+        Tailor the base CV for many jobs concurrently with one shared tailor.
+        Each job is a dict of tailor_for_job keyword arguments
+        (job_title, company, location, job_description).
+        Results are returned in job order.
+        """
+        tailor = cls(base_cv_path, settings)
+        semaphore = asyncio.Semaphore(concurrency or tailor.settings.generator_concurrency)
+
+        async def tailor_one(job: dict[str, str]) -> TailoringResult:
+            async with semaphore:
+                return await tailor.tailor_for_job(**job)
+
+        results = await asyncio.gather(*map(tailor_one, jobs), return_exceptions=True)
+        return [
+            result if isinstance(result, TailoringResult) else TailoringResult(
+                success=False,
+                tailored_cv={},
+                cover_letter="",
+                ats_keywords=[],
+                error=str(result),
+            )
+            for result in results
+        ]
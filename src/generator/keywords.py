@@ -0,0 +1,92 @@
+"""
+Keyword matching helpers.
+Finds which keywords of a fixed set occur in a text with a single regex scan.
+"""
+
+import re
+from collections import Counter
+from collections.abc import Iterable, Iterator
+
+
+class KeywordMatcher:
+    """Case-insensitive substring matcher for a fixed keyword set."""
+
+    def __init__(self, keywords: Iterable[str]):
+        # Multiplicity keeps duplicate keywords counting once each, like repeated `in` checks
+        self.multiplicity = Counter(kw.lower() for kw in keywords if kw)
+
+        # Longest alternative first so each start position reports its longest keyword;
+        # the zero-width lookahead lets matches overlap
+        ordered = sorted(self.multiplicity, key=len, reverse=True)
+        self.pattern = (
+            re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))") if ordered else None
+        )
+
+        # Shorter keywords starting at the same position are prefixes of the reported one
+        self.prefixes = {
+            kw: tuple(other for other in ordered if other != kw and kw.startswith(other))
+            for kw in ordered
+        }
+
+        # CV texts are scored more than once per job (highlights, then their entries)
+        self._counts: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.multiplicity)
+
+    def iter_matches(self, text_lower: str) -> Iterator[tuple[str, int]]:
+        """Yield (keyword, end_offset) for every keyword occurrence in lowercased text."""
+        if self.pattern is None:
+            return
+        for match in self.pattern.finditer(text_lower):
+            longest = match.group(1)
+            end = match.end(1)
+            yield longest, end
+            for prefix in self.prefixes[longest]:
+                yield prefix, match.start(1) + len(prefix)
+
+    def find(self, text_lower: str) -> set[str]:
+        """Return the set of keywords occurring in lowercased text."""
+        return {kw for kw, _ in self.iter_matches(text_lower)}
+
+    def count(self, text: str) -> int:
+        """Count how many keywords appear in the text (case-insensitive)."""
+        if not text:
+            return 0
+        count = self._counts.get(text)
+        if count is None:
+            count = self._counts[text] = sum(
+                self.multiplicity[kw] for kw in self.find(text.lower())
+            )
+        return count
+
+
+class SemanticKeywordScorer:
+    """
+    Keyword scorer that also counts semantically similar keywords.
+    Wraps a KeywordMatcher; `semantic_hits` maps a text to the lowercased
+    keywords whose embeddings are close to it.
+    """
+
+    def __init__(self, matcher: KeywordMatcher, semantic_hits: dict[str, set[str]]):
+        self.matcher = matcher
+        self.semantic_hits = semantic_hits
+        self._counts: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.matcher)
+
+    @property
+    def matched_keywords(self) -> set[str]:
+        """Lowercased keywords semantically close to at least one text."""
+        return set().union(*self.semantic_hits.values())
+
+    def count(self, text: str) -> int:
+        """Count keywords that appear in or are semantically close to the text."""
+        if not text:
+            return 0
+        count = self._counts.get(text)
+        if count is None:
+            found = self.matcher.find(text.lower()) | self.semantic_hits.get(text, set())
+            count = self._counts[text] = sum(self.matcher.multiplicity[kw] for kw in found)
+        return count
@@ -2,15 +2,182 @@
 LLM-based resume and cover letter generator using OpenAI.
 """
 
-from typing import Optional
+import asyncio
+import hashlib
+import json
+from collections.abc import AsyncIterator
+from typing import Any, Optional
 
 from loguru import logger
 from openai import AsyncOpenAI
 
 from shared.config import Settings, get_settings
+from shared.database import Database
+from shared.openai_client import get_openai_client
 from generator.profile import ProfileLoader
 
 
+# Batch API polling interval; batches complete within the 24h window, usually much sooner
+BATCH_POLL_SECONDS = 30
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+async def run_chat_batch(client: AsyncOpenAI, requests: dict[str, dict[str, Any]]) -> dict[str, str]:
+    """
+    Run chat completions through the OpenAI Batch API (half the price of online calls).
+
+    Args:
+        client: OpenAI client
+        requests: Map of custom_id to chat.completions request body
+
+    Returns:
+        Map of custom_id to completion content (failed requests are omitted)
+    """
+    if not requests:
+        return {}
+
+    lines = "\n".join(
+        json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body,
+        })
+        for custom_id, body in requests.items()
+    )
+    batch_file = await client.files.create(
+        file=("batch.jsonl", lines.encode("utf-8")), purpose="batch"
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        await asyncio.sleep(BATCH_POLL_SECONDS)
+        batch = await client.batches.retrieve(batch.id)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+    if not batch.output_file_id:
+        logger.warning(f"Batch {batch.id} produced no output (all requests failed)")
+        return {}
+
+    output = await client.files.content(batch.output_file_id)
+    results: dict[str, str] = {}
+    for line in output.text.splitlines():
+        if not line:
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            logger.warning(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+            continue
+        content = response["body"]["choices"][0]["message"]["content"]
+        results[record["custom_id"]] = content.strip() if content else ""
+
+    logger.info(f"Batch {batch.id} completed: {len(results)}/{len(requests)} succeeded")
+    return results
+
+
+async def stream_completion(client: AsyncOpenAI, request: dict[str, Any]) -> AsyncIterator[str]:
+    """Stream a chat completion, yielding content deltas as they arrive."""
+    stream = await client.chat.completions.create(**request, stream=True)
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
+# Jobs per bulk resume request; each resume gets its own output token budget
+BULK_MAX_JOBS = 5
+
+# Prompts ask the model to finish with this line so generation stops before the token cap;
+# it must not look like Markdown, or a heading such as "# Endorsements" would cut output short
+END_SENTINEL = "\n<<END>>"
+
+# Structured output schema for bulk resume generation
+BULK_RESUMES_SCHEMA = {
+    "name": "resumes",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "resumes": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "job_id": {"type": "string"},
+                        "markdown": {"type": "string"},
+                    },
+                    "required": ["job_id", "markdown"],
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["resumes"],
+        "additionalProperties": False,
+    },
+}
+
+
+# Section-wise resumes: heading, profile sections given as context, share of the
+# resume token budget and what to write. Sections are generated concurrently and
+# assembled in this order below a header copied verbatim from the profile.
+RESUME_SECTIONS: dict[str, tuple[str, tuple[str, ...], float, str]] = {
+    "summary": (
+        "Professional Summary",
+        ("summary", "experience"),
+        0.15,
+        "Write a 3-4 sentence professional summary positioning the candidate for this job.",
+    ),
+    "experience": (
+        "Work Experience",
+        ("experience",),
+        0.55,
+        "Rewrite the work experience, most relevant roles and achievements first. "
+        "Use action verbs and quantify achievements where possible.",
+    ),
+    "education": (
+        "Education",
+        ("education", "certifications"),
+        0.15,
+        "List education and the certifications most relevant to this job.",
+    ),
+    "skills": (
+        "Skills",
+        ("skills", "languages"),
+        0.15,
+        "Group the skills most relevant to this job by category and list languages.",
+    ),
+}
+
+
+def output_cache_key(
+    kind: str,
+    model: str,
+    profile_context: str,
+    job_title: str,
+    company: str,
+    job_description: str,
+    matched_keywords: list[str],
+) -> str:
+    """Hash the inputs of a generation; equal inputs reuse the cached output."""
+    payload = [
+        kind,
+        model,
+        hashlib.sha256(profile_context.encode("utf-8")).hexdigest(),
+        job_title.strip().casefold(),
+        company.strip().casefold(),
+        # Reposted jobs often differ only in whitespace or case
+        " ".join(job_description.split()).casefold(),
+        sorted({kw.casefold() for kw in matched_keywords}),
+    ]
+    return hashlib.sha256(json.dumps(payload).encode("utf-8")).hexdigest()
+
+
 class ResumeGenerator:
     """Generates tailored resumes using LLM."""
 
@@ -18,20 +185,65 @@ class ResumeGenerator:
         self,
         profile_loader: ProfileLoader,
         settings: Optional[Settings] = None,
+        db: Optional[Database] = None,
     ):
         self.settings = settings or get_settings()
         self.profile_loader = profile_loader
+        # Optional output cache; without a database every call hits the LLM
+        self.db = db
         self._client: Optional[AsyncOpenAI] = None
 
     @property
     def client(self) -> AsyncOpenAI:
-        """Get or create OpenAI client."""
+        """Get the shared OpenAI client."""
         if self._client is None:
-            self._client = AsyncOpenAI(
-                api_key=self.settings.openai_api_key.get_secret_value()
-            )
+            self._client = get_openai_client(self.settings.openai_api_key.get_secret_value())
         return self._client
 
+    def _build_request(
+        self,
+        job_title: str,
+        job_description: str,
+        company: str,
+        matched_keywords: list[str],
+    ) -> dict[str, Any]:
+        """Build the chat completion request body for a tailored resume."""
+        prompt = f"""You are an expert resume writer. Create a tailored resume for the following job.
+
+## Target Job:
+**Position:** {job_title}
+**Company:** {company}
+**Matched Keywords:** {', '.join(matched_keywords)}
+
+## Job Description:
+{job_description}
+
+## Instructions:
+1. Create a professional resume tailored to this specific job
+2. Emphasize experiences and skills that match the job requirements
+3. Include the matched keywords naturally where relevant
+4. Use action verbs and quantify achievements where possible
+5. Keep it concise (max 2 pages when printed)
+6. Format in clean Markdown
+
+Output ONLY the resume content in Markdown format, nothing else, then a final line "<<END>>"."""
+
+        return {
+            "model": self.settings.openai_model,
+            # Static system prompt + profile first so OpenAI prompt caching reuses the prefix
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are an expert resume writer who creates tailored, ATS-friendly resumes."
+                    f"\n\n## Candidate Profile:\n{self.profile_loader.context_string}",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.7,
+            "max_tokens": self.settings.generator_resume_max_tokens,
+            "stop": [END_SENTINEL],
+        }
+
     async def generate_resume(
         self,
         job_title: str,
@@ -45,12 +257,82 @@ class ResumeGenerator:
         Returns:
             Resume content in Markdown format
         """
-        profile_context = self.profile_loader.to_context_string()
+        cache_key = output_cache_key(
+            "resume_sections" if self.settings.generator_resume_sections else "resume",
+            self.settings.openai_model, self.profile_loader.context_string,
+            job_title, company, job_description, matched_keywords,
+        )
+        if self.db:
+            cached = await self.db.get_cached_llm_output(cache_key)
+            if cached is not None:
+                logger.info(f"Reusing cached resume for {job_title} at {company}")
+                return cached
 
-        prompt = f"""You are an expert resume writer. Create a tailored resume for the following job.
+        if self.settings.generator_resume_sections:
+            content = await self._generate_resume_sections(
+                job_title, job_description, company, matched_keywords
+            )
+        else:
+            parts = [
+                delta async for delta in self.stream_resume(
+                    job_title, job_description, company, matched_keywords
+                )
+            ]
+            content = "".join(parts).strip()
 
-## Candidate Profile:
-{profile_context}
+        if self.db and content:
+            await self.db.set_cached_llm_output(cache_key, content)
+
+        logger.info(f"Generated resume for {job_title} at {company}")
+        return content
+
+    async def _generate_resume_sections(
+        self,
+        job_title: str,
+        job_description: str,
+        company: str,
+        matched_keywords: list[str],
+    ) -> str:
+        """
+        Generate a resume as concurrent per-section completions.
+        Smaller prompts and outputs decode in parallel, so latency is that of
+        the longest section instead of the whole resume.
+        """
+        sections = [
+            name for name, (_, profile_sections, _, _) in RESUME_SECTIONS.items()
+            if self.profile_loader.section_context(*profile_sections)
+        ]
+        bodies = await asyncio.gather(*(
+            self._generate_resume_section(
+                name, job_title, job_description, company, matched_keywords
+            )
+            for name in sections
+        ))
+
+        personal = self.profile_loader.profile.personal
+        contact = " | ".join(
+            value for value in (
+                personal.email, personal.phone, personal.location,
+                personal.linkedin, personal.github, personal.website,
+            )
+            if value
+        )
+        parts = [f"# {personal.name}\n{contact}".strip()]
+        parts.extend(body for body in bodies if body)
+        return "\n\n".join(parts)
+
+    async def _generate_resume_section(
+        self,
+        section: str,
+        job_title: str,
+        job_description: str,
+        company: str,
+        matched_keywords: list[str],
+    ) -> str:
+        """Generate one resume section in Markdown."""
+        heading, profile_sections, token_share, instruction = RESUME_SECTIONS[section]
+
+        prompt = f"""Write the "{heading}" section of a resume tailored to the following job.
 
 ## Target Job:
 **Position:** {job_title}
@@ -61,31 +343,143 @@ class ResumeGenerator:
 {job_description}
 
 ## Instructions:
-1. Create a professional resume tailored to this specific job
-2. Emphasize experiences and skills that match the job requirements
-3. Include the matched keywords naturally where relevant
-4. Use action verbs and quantify achievements where possible
-5. Keep it concise (max 2 pages when printed)
-6. Format in clean Markdown
+{instruction}
+Include the matched keywords naturally where relevant and format in clean Markdown.
 
-Output ONLY the resume content in Markdown format, nothing else."""
+Output ONLY the section, starting with the heading "## {heading}", nothing else, then a final line "<<END>>"."""
 
-        response = await self.client.chat.completions.create(
-            model=self.settings.openai_model,
-            messages=[
+        request = {
+            "model": self.settings.openai_model,
+            "messages": [
                 {
                     "role": "system",
-                    "content": "You are an expert resume writer who creates tailored, ATS-friendly resumes.",
+                    "content": "You are an expert resume writer who creates tailored, ATS-friendly resumes."
+                    f"\n\n## Candidate Profile:\n{self.profile_loader.section_context(*profile_sections)}",
                 },
                 {"role": "user", "content": prompt},
             ],
-            temperature=0.7,
-            max_tokens=3000,
+            "temperature": 0.7,
+            "max_tokens": int(self.settings.generator_resume_max_tokens * token_share),
+            "stop": [END_SENTINEL],
+        }
+        parts = [delta async for delta in stream_completion(self.client, request)]
+        return "".join(parts).strip()
+
+    def stream_resume(
+        self,
+        job_title: str,
+        job_description: str,
+        company: str,
+        matched_keywords: list[str],
+    ) -> AsyncIterator[str]:
+        """
+        Stream a tailored resume as Markdown deltas.
+        Lets callers start other work (e.g. PDF setup) while tokens arrive.
+        """
+        return stream_completion(
+            self.client,
+            self._build_request(job_title, job_description, company, matched_keywords),
         )
 
-        content = response.choices[0].message.content
-        logger.info(f"Generated resume for {job_title} at {company}")
-        return content.strip() if content else ""
+    async def generate_resume_batch(self, jobs: list[dict[str, Any]]) -> dict[str, str]:
+        """
+        Generate tailored resumes for many jobs through the Batch API.
+        For non-interactive runs: half the cost and no per-minute request limits,
+        but results can take minutes to hours.
+
+        Args:
+            jobs: Dicts with job_id plus the generate_resume arguments
+                (job_title, job_description, company, matched_keywords)
+
+        Returns:
+            Map of job_id to resume content in Markdown format
+        """
+        requests = {
+            str(job["job_id"]): self._build_request(
+                job["job_title"], job["job_description"], job["company"], job["matched_keywords"]
+            )
+            for job in jobs
+        }
+        return await run_chat_batch(self.client, requests)
+
+    async def generate_resumes_bulk(self, jobs: list[dict[str, Any]]) -> dict[str, str]:
+        """
+        Generate tailored resumes for several jobs per chat completion.
+        Helps under requests-per-minute limits: the profile is sent once per
+        request of up to BULK_MAX_JOBS jobs instead of once per job.
+
+        Args:
+            jobs: Dicts with job_id plus the generate_resume arguments
+                (job_title, job_description, company, matched_keywords)
+
+        Returns:
+            Map of job_id to resume content in Markdown format (failed jobs are omitted)
+        """
+        chunks = [jobs[i:i + BULK_MAX_JOBS] for i in range(0, len(jobs), BULK_MAX_JOBS)]
+        results: dict[str, str] = {}
+        for chunk_results in await asyncio.gather(*map(self._generate_resume_chunk, chunks)):
+            results.update(chunk_results)
+        return results
+
+    async def _generate_resume_chunk(self, jobs: list[dict[str, Any]]) -> dict[str, str]:
+        """Generate resumes for up to BULK_MAX_JOBS jobs in one structured-output request."""
+        job_sections = "\n\n".join(
+            f"""### Job {n} (job_id: {job['job_id']})
+**Position:** {job['job_title']}
+**Company:** {job['company']}
+**Matched Keywords:** {', '.join(job['matched_keywords'])}
+
+**Job Description:**
+{job['job_description']}"""
+            for n, job in enumerate(jobs, 1)
+        )
+
+        prompt = f"""You are an expert resume writer. Create one tailored resume for EACH of the following {len(jobs)} jobs.
+
+## Target Jobs:
+{job_sections}
+
+## Instructions:
+1. Create a professional resume tailored to each specific job
+2. Emphasize experiences and skills that match the job requirements
+3. Include the matched keywords naturally where relevant
+4. Use action verbs and quantify achievements where possible
+5. Keep each resume concise (max 2 pages when printed)
+6. Format each resume in clean Markdown
+
+Return {{"resumes": [{{"job_id": ..., "markdown": ...}}, ...]}} with one entry per job, using the job_id given for each job."""
+
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.settings.openai_model,
+                # Static system prompt + profile first so OpenAI prompt caching reuses the prefix
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert resume writer who creates tailored, ATS-friendly resumes."
+                        f"\n\n## Candidate Profile:\n{self.profile_loader.context_string}",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.7,
+                max_tokens=self.settings.generator_resume_max_tokens * len(jobs),
+                response_format={"type": "json_schema", "json_schema": BULK_RESUMES_SCHEMA},
+            )
+
+            content = response.choices[0].message.content
+            resumes = json.loads(content)["resumes"] if content else []
+        except Exception as e:
+            logger.error(f"Bulk resume generation failed for {len(jobs)} jobs: {e}")
+            return {}
+
+        job_ids = {str(job["job_id"]) for job in jobs}
+        results = {
+            resume["job_id"]: resume["markdown"].strip()
+            for resume in resumes
+            if resume["job_id"] in job_ids
+        }
+        logger.info(f"Generated {len(results)}/{len(jobs)} resumes in one request")
+        return results
 
 
 class CoverLetterGenerator:
@@ -95,18 +489,19 @@ class CoverLetterGenerator:
         self,
         profile_loader: ProfileLoader,
         settings: Optional[Settings] = None,
+        db: Optional[Database] = None,
     ):
         self.settings = settings or get_settings()
         self.profile_loader = profile_loader
+        # Optional output cache; without a database every call hits the LLM
+        self.db = db
         self._client: Optional[AsyncOpenAI] = None
 
     @property
     def client(self) -> AsyncOpenAI:
-        """Get or create OpenAI client."""
+        """Get the shared OpenAI client."""
         if self._client is None:
-            self._client = AsyncOpenAI(
-                api_key=self.settings.openai_api_key.get_secret_value()
-            )
+            self._client = get_openai_client(self.settings.openai_api_key.get_secret_value())
         return self._client
 
     async def generate_cover_letter(
@@ -122,14 +517,20 @@ class CoverLetterGenerator:
         Returns:
             Cover letter content in Markdown format
         """
+        cache_key = output_cache_key(
+            "cover_letter", self.settings.openai_model, self.profile_loader.context_string,
+            job_title, company, job_description, matched_keywords,
+        )
+        if self.db:
+            cached = await self.db.get_cached_llm_output(cache_key)
+            if cached is not None:
+                logger.info(f"Reusing cached cover letter for {job_title} at {company}")
+                return cached
+
         profile = self.profile_loader.profile
-        profile_context = self.profile_loader.to_context_string()
 
         prompt = f"""You are an expert cover letter writer. Create a compelling cover letter for the following job.
 
-## Candidate Profile:
-{profile_context}
-
 ## Target Job:
 **Position:** {job_title}
 **Company:** {company}
@@ -147,21 +548,28 @@ class CoverLetterGenerator:
 6. Include a strong opening and call to action
 7. Sign with the candidate's name: {profile.personal.name}
 
-Output ONLY the cover letter content, nothing else."""
+Output ONLY the cover letter content, nothing else, then a final line "<<END>>"."""
 
-        response = await self.client.chat.completions.create(
-            model=self.settings.openai_model,
-            messages=[
+        request = {
+            "model": self.settings.openai_model,
+            # Static system prompt + profile first so OpenAI prompt caching reuses the prefix
+            "messages": [
                 {
                     "role": "system",
-                    "content": "You are an expert cover letter writer who creates compelling, personalized letters.",
+                    "content": "You are an expert cover letter writer who creates compelling, personalized letters."
+                    f"\n\n## Candidate Profile:\n{self.profile_loader.context_string}",
                 },
                 {"role": "user", "content": prompt},
             ],
-            temperature=0.7,
-            max_tokens=1500,
-        )
+            "temperature": 0.7,
+            "max_tokens": self.settings.generator_cover_letter_max_tokens,
+            "stop": [END_SENTINEL],
+        }
+        parts = [delta async for delta in stream_completion(self.client, request)]
+        content = "".join(parts).strip()
+
+        if self.db and content:
+            await self.db.set_cached_llm_output(cache_key, content)
 
-        content = response.choices[0].message.content
         logger.info(f"Generated cover letter for {job_title} at {company}")
-        return content.strip() if content else ""
+        return content
@@ -15,19 +15,21 @@ if sys.platform == "darwin":
     if os.path.exists(homebrew_lib):
         os.environ["DYLD_LIBRARY_PATH"] = homebrew_lib
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import click
 from loguru import logger
 
+from shared import event_loop
 from shared.config import get_settings
 from shared.database import Database
+from shared.openai_client import close_openai_clients
 
 from generator.cv_tailor import CVTailor
 from generator.rendercv_generator import RenderCVGenerator
 from generator.email_service import EmailService
 
+# Buffered database writes (jobs not emailed) are flushed once this many accumulate
+DB_FLUSH_SIZE = 50
+
 
 def setup_logging():
     """Configure loguru logging."""
@@ -90,7 +92,8 @@ async def generate_and_email_applications(
         output_dir=Path(settings.generator_output_dir),
     )
 
-    email_service = EmailService(settings=settings) if not skip_email else None
+    # Dry runs never send email, so don't set up the client
+    email_service = EmailService(settings=settings) if not (skip_email or dry_run) else None
 
     try:
         # Get high-match jobs that haven't been generated
@@ -105,11 +108,49 @@ async def generate_and_email_applications(
 
         logger.info(f"Found {len(jobs)} high-match jobs to process")
 
-        total_processed = 0
-        successful = 0
-        failed = 0
+        # Jobs recorded by an interrupted run already have an application; just
+        # mark them generated instead of paying for the LLM calls again
+        existing = await db.get_existing_application_job_ids([str(job["id"]) for job in jobs])
+        if existing:
+            logger.info(f"Skipping {len(existing)} jobs that already have applications")
+            if not dry_run:
+                await db.bulk_update_job_generated(list(existing), status="generated")
+            jobs = [job for job in jobs if str(job["id"]) not in existing]
+
+        # Jobs are independent; bound how many run at once to respect API rate limits
+        semaphore = asyncio.Semaphore(settings.generator_concurrency)
+
+        # Database writes for jobs that were not emailed are buffered and flushed in
+        # batches; an emailed job is recorded at once so a later run can't resend it
+        pending_applications: list[dict] = []
+        pending_generated: list[str] = []
+        pending_errors: list[str] = []
+
+        async def flush_writes() -> None:
+            """Write buffered applications and job status updates, keeping any left unwritten."""
+            applications = pending_applications[:]
+            generated = pending_generated[:]
+            errors = pending_errors[:]
+            pending_applications.clear()
+            pending_generated.clear()
+            pending_errors.clear()
 
-        for job in jobs:
+            try:
+                # Applications go first so a generated job always has its record
+                await db.bulk_insert_applications(applications)
+                applications = []
+                await db.bulk_update_job_generated(generated, status="generated")
+                generated = []
+                await db.bulk_update_job_statuses(errors, "error")
+                errors = []
+            finally:
+                # Rows not written go back in the buffers for the next flush
+                pending_applications[:0] = applications
+                pending_generated[:0] = generated
+                pending_errors[:0] = errors
+
+        async def process_job(job: dict) -> bool:
+            """Generate, email and record the application for one job. Returns True on success."""
             job_id = str(job["id"])
             title = job.get("title", "Unknown")
             company = job.get("company", "Unknown")
@@ -117,94 +158,129 @@ async def generate_and_email_applications(
             description = job.get("description", "")
             llm_score = job.get("llm_match_score", 0)
 
-            logger.info(f"Processing: {title} at {company} (score: {llm_score}/5)")
+            async with semaphore:
+                logger.info(f"Processing: {title} at {company} (score: {llm_score}/5)")
 
-            try:
-                # Step 1: Tailor CV and generate cover letter
-                logger.debug("Tailoring CV and generating cover letter...")
-                tailoring_result = await cv_tailor.tailor_for_job(
-                    job_title=title,
-                    company=company,
-                    location=location,
-                    job_description=description,
-                )
-
-                if not tailoring_result.success:
-                    logger.error(f"Tailoring failed: {tailoring_result.error}")
-                    failed += 1
-                    continue
-
-                # Step 2: Generate PDF with RenderCV
-                logger.debug("Generating PDF with RenderCV...")
-                pdf_result = pdf_generator.generate_pdf(
-                    cv_data=tailoring_result.tailored_cv,
-                    job_id=job_id,
-                    company=company,
-                )
-
-                if not pdf_result.success:
-                    logger.error(f"PDF generation failed: {pdf_result.error}")
-                    failed += 1
-                    continue
-
-                # Step 3: Generate cover letter PDF
-                cv_name = tailoring_result.tailored_cv.get("cv", {}).get("name", "Candidate")
-                cover_letter_pdf = pdf_generator.generate_cover_letter_pdf(
-                    cover_letter=tailoring_result.cover_letter,
-                    job_id=job_id,
-                    company=company,
-                    job_title=title,
-                    candidate_name=cv_name,
-                )
-
-                # Step 4: Send email (unless skip_email or dry_run)
-                if email_service and not dry_run:
-                    logger.debug("Sending email via Resend...")
-                    email_result = email_service.send_application_package(
-                        job=job,
-                        cv_pdf_path=pdf_result.pdf_path,
+                try:
+                    # Step 1: Tailor CV and generate cover letter
+                    logger.debug("Tailoring CV and generating cover letter...")
+                    tailoring_result = await cv_tailor.tailor_for_job(
+                        job_title=title,
+                        company=company,
+                        location=location,
+                        job_description=description,
+                    )
+
+                    if not tailoring_result.success:
+                        logger.error(f"Tailoring failed: {tailoring_result.error}")
+                        return False
+
+                    # Steps 2-3: Generate the CV PDF (RenderCV) and cover letter PDF
+                    # (WeasyPrint) concurrently, off the event loop
+                    logger.debug("Generating CV and cover letter PDFs...")
+                    cv_name = tailoring_result.tailored_cv.get("cv", {}).get("name", "Candidate")
+                    pdf_result, cover_letter_pdf = await pdf_generator.generate_application_pdfs(
+                        cv_data=tailoring_result.tailored_cv,
                         cover_letter=tailoring_result.cover_letter,
-                        ats_keywords=tailoring_result.ats_keywords,
-                        cover_letter_pdf_path=cover_letter_pdf,
+                        job_id=job_id,
+                        company=company,
+                        job_title=title,
+                        candidate_name=cv_name,
+                    )
+
+                    if not pdf_result.success:
+                        logger.error(f"PDF generation failed: {pdf_result.error}")
+                        return False
+
+                    # Step 4: Send email (unless skip_email or dry_run)
+                    if email_service:
+                        logger.debug("Sending email via Resend...")
+                        email_result = await asyncio.to_thread(
+                            email_service.send_application_package,
+                            job=job,
+                            cv_pdf_path=pdf_result.pdf_path,
+                            cover_letter=tailoring_result.cover_letter,
+                            ats_keywords=tailoring_result.ats_keywords,
+                            cover_letter_pdf_path=cover_letter_pdf,
+                        )
+
+                        if not email_result.success:
+                            logger.error(f"Email failed: {email_result.error}")
+                            # Still count as success if PDF was generated
+                            logger.warning("PDF generated but email failed - marking as generated")
+
+                    # Step 5: Update database (unless dry_run)
+                    if not dry_run:
+                        # Store application record
+                        application = {
+                            "job_id": job_id,
+                            "job_title": title,
+                            "company": company,
+                            "resume_content": None,  # Stored as YAML
+                            "cover_letter_content": tailoring_result.cover_letter,
+                            "resume_path": str(pdf_result.pdf_path) if pdf_result.pdf_path else None,
+                            "cover_letter_path": str(cover_letter_pdf) if cover_letter_pdf else None,
+                            "status": "pending",
+                            "notes": f"ATS keywords: {', '.join(tailoring_result.ats_keywords[:10])}",
+                        }
+                        if email_service:
+                            # The email is out; record it now so a crash can't lead to a resend
+                            await db.insert_application(application)
+                            await db.update_job_generated(job_id, status="generated")
+                        else:
+                            pending_applications.append(application)
+
+                            # Mark job as generated
+                            pending_generated.append(job_id)
+
+                    logger.info(
+                        f"SUCCESS: Generated application for {title} at {company} "
+                        f"(PDF: {pdf_result.pdf_path})"
                     )
+                    success = True
+
+                except Exception as e:
+                    logger.error(f"Failed to process {title} at {company}: {e}")
+
+                    if not dry_run:
+                        pending_errors.append(job_id)
+                    success = False
+
+            return success
+
+        # Flushes run here rather than inside a job, so a failed write is never blamed on one
+        tasks = [asyncio.create_task(process_job(job)) for job in jobs]
+        results: list[bool] = []
+        try:
+            for task in asyncio.as_completed(tasks):
+                try:
+                    results.append(await task)
+                except Exception as e:
+                    logger.error(f"Job processing failed: {e}")
+                    results.append(False)
+
+                if len(pending_applications) + len(pending_errors) >= DB_FLUSH_SIZE:
+                    try:
+                        await flush_writes()
+                    except Exception as e:
+                        logger.error(f"Failed to store buffered results, retrying later: {e}")
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        try:
+            await flush_writes()
+        except Exception as e:
+            # None of these jobs was emailed; unrecorded ones are simply picked up next run
+            logger.error(
+                f"Failed to store buffered results: {e}. "
+                f"Not recorded: applications for {[a['job_id'] for a in pending_applications]}, "
+                f"generated status for {pending_generated}, error status for {pending_errors}"
+            )
 
-                    if not email_result.success:
-                        logger.error(f"Email failed: {email_result.error}")
-                        # Still count as success if PDF was generated
-                        logger.warning("PDF generated but email failed - marking as generated")
-
-                # Step 5: Update database (unless dry_run)
-                if not dry_run:
-                    # Store application record
-                    application = {
-                        "job_id": job_id,
-                        "job_title": title,
-                        "company": company,
-                        "resume_content": None,  # Stored as YAML
-                        "cover_letter_content": tailoring_result.cover_letter,
-                        "resume_path": str(pdf_result.pdf_path) if pdf_result.pdf_path else None,
-                        "cover_letter_path": str(cover_letter_pdf) if cover_letter_pdf else None,
-                        "status": "pending",
-                        "notes": f"ATS keywords: {', '.join(tailoring_result.ats_keywords[:10])}",
-                    }
-                    await db.insert_application(application)
-
-                    # Mark job as generated
-                    await db.update_job_generated(job_id, status="generated")
-
-                total_processed += 1
-                successful += 1
-                logger.info(
-                    f"SUCCESS: Generated application for {title} at {company} "
-                    f"(PDF: {pdf_result.pdf_path})"
-                )
-
-            except Exception as e:
-                logger.error(f"Failed to process {title} at {company}: {e}")
-                failed += 1
-
-                if not dry_run:
-                    await db.update_job_status(job_id, "error")
+        successful = sum(results)
+        failed = len(results) - successful
+        total_processed = successful
 
         logger.info(
             f"Generation complete: {total_processed} processed, "
@@ -215,6 +291,7 @@ async def generate_and_email_applications(
 
     finally:
         await db.disconnect()
+        await close_openai_clients()
 
 
 @click.command()
@@ -292,9 +369,9 @@ def main(
                 logger.info(f"Sleeping for {interval} seconds ({interval/3600:.1f} hours)")
                 await asyncio.sleep(interval)
 
-        asyncio.run(run_daemon())
+        event_loop.run(run_daemon())
     else:
-        total, success, failed = asyncio.run(
+        total, success, failed = event_loop.run(
             generate_and_email_applications(
                 limit=limit,
                 min_score=min_score,
@@ -3,15 +3,24 @@ PDF generation for resumes and cover letters.
 Uses WeasyPrint for HTML-to-PDF conversion with custom styling.
 """
 
+import asyncio
+import re
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-import markdown
+import aiofiles
 from loguru import logger
-from weasyprint import HTML, CSS
+from markdown_it import MarkdownIt
 
 
+# CommonMark (fenced code included) plus GFM tables, built once
+_MARKDOWN = MarkdownIt("commonmark").enable("table")
+
+# Characters replaced in filenames: \W is exactly "not str.isalnum()" apart from "_", which stays "_"
+_UNSAFE_FILENAME_RE = re.compile(r"\W")
+
 # Modern, clean CSS for PDF generation
 PDF_CSS = """
 @page {
@@ -98,20 +107,33 @@ a {
 """
 
 
+@lru_cache(maxsize=1)
+def _compiled_css():
+    """Parse PDF_CSS once and reuse the stylesheet for every PDF."""
+    from weasyprint import CSS
+
+    return CSS(string=PDF_CSS)
+
+
 class PDFGenerator:
-    """Generates PDF documents from Markdown content."""
+    """
+    Generates PDF documents from Markdown content.
+    backend="weasyprint" (default) lays out HTML with PDF_CSS; backend="reportlab"
+    draws simple documents directly and is much faster, without full CSS layout.
+    """
+
+    BACKENDS = ("weasyprint", "reportlab")
 
-    def __init__(self, output_dir: Optional[Path] = None):
+    def __init__(self, output_dir: Optional[Path] = None, backend: str = "weasyprint"):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown PDF backend: {backend} (expected one of {self.BACKENDS})")
         self.output_dir = output_dir or Path("./output")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.backend = backend
 
     def _markdown_to_html(self, content: str, is_cover_letter: bool = False) -> str:
         """Convert Markdown to HTML."""
-        # Convert Markdown to HTML
-        html_content = markdown.markdown(
-            content,
-            extensions=["tables", "fenced_code"],
-        )
+        html_content = _MARKDOWN.render(content)
 
         # Wrap in document structure
         wrapper_class = "cover-letter" if is_cover_letter else "resume"
@@ -128,6 +150,19 @@ class PDFGenerator:
 
         return html
 
+    def _render_bytes(self, content: str, is_cover_letter: bool = False) -> bytes:
+        """Render Markdown content to PDF bytes with the configured backend."""
+        if self.backend == "reportlab":
+            from generator.reportlab_renderer import render_markdown_pdf
+
+            return render_markdown_pdf(content, is_cover_letter)
+
+        # Imported on first use: WeasyPrint loads cairo/pango, which is slow and heavy
+        from weasyprint import HTML
+
+        html = HTML(string=self._markdown_to_html(content, is_cover_letter))
+        return html.write_pdf(stylesheets=[_compiled_css()])
+
     def generate_pdf(
         self,
         content: str,
@@ -145,14 +180,35 @@ class PDFGenerator:
         Returns:
             Path to generated PDF
         """
-        html_content = self._markdown_to_html(content, is_cover_letter)
         output_path = self.output_dir / f"{filename}.pdf"
+        output_path.write_bytes(self._render_bytes(content, is_cover_letter))
 
-        # Generate PDF
-        html = HTML(string=html_content)
-        css = CSS(string=PDF_CSS)
+        logger.info(f"Generated PDF: {output_path}")
+        return output_path
 
-        html.write_pdf(output_path, stylesheets=[css])
+    async def generate_pdf_async(
+        self,
+        content: str,
+        filename: str,
+        is_cover_letter: bool = False,
+    ) -> Path:
+        """
+        Generate PDF from Markdown content without blocking the event loop.
+        Renders in a worker thread and writes the file asynchronously.
+
+        Args:
+            content: Markdown content
+            filename: Output filename (without extension)
+            is_cover_letter: Whether this is a cover letter (affects styling)
+
+        Returns:
+            Path to generated PDF
+        """
+        data = await asyncio.to_thread(self._render_bytes, content, is_cover_letter)
+
+        output_path = self.output_dir / f"{filename}.pdf"
+        async with aiofiles.open(output_path, "wb") as f:
+            await f.write(data)
 
         logger.info(f"Generated PDF: {output_path}")
         return output_path
@@ -165,7 +221,7 @@ class PDFGenerator:
     ) -> Path:
         """Generate resume PDF with standardized filename."""
         # Sanitize company name for filename
-        safe_company = "".join(c if c.isalnum() else "_" for c in company)
+        safe_company = _UNSAFE_FILENAME_RE.sub("_", company)
         filename = f"resume_{safe_company}_{job_id}"
         return self.generate_pdf(content, filename, is_cover_letter=False)
 
@@ -176,6 +232,6 @@ class PDFGenerator:
         company: str,
     ) -> Path:
         """Generate cover letter PDF with standardized filename."""
-        safe_company = "".join(c if c.isalnum() else "_" for c in company)
+        safe_company = _UNSAFE_FILENAME_RE.sub("_", company)
         filename = f"cover_letter_{safe_company}_{job_id}"
         return self.generate_pdf(content, filename, is_cover_letter=True)
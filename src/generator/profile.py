@@ -3,15 +3,26 @@ User profile loader and manager.
 Loads professional profile from YAML for CV generation.
 """
 
+import dataclasses
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
 import yaml
 from loguru import logger
 
+from shared.dataclass_loader import from_dict
+from shared.file_cache import load_cached, source_key, store_cached
 
-@dataclass
+# Use libyaml's C loader when available
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bump when the profile dataclasses change so stale pickled profiles are ignored
+PROFILE_CACHE_VERSION = 2
+
+
+@dataclass(slots=True)
 class PersonalInfo:
     """Personal contact information."""
 
@@ -24,7 +35,7 @@ class PersonalInfo:
     website: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkExperience:
     """Work experience entry."""
 
@@ -38,7 +49,7 @@ class WorkExperience:
     technologies: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Education:
     """Education entry."""
 
@@ -48,10 +59,11 @@ class Education:
     location: str = ""
     graduation_date: str = ""
     gpa: str = ""
-    achievements: list[str] = field(default_factory=list)
+    # The "field" attribute above shadows dataclasses.field inside this class body
+    achievements: list[str] = dataclasses.field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Certification:
     """Certification entry."""
 
@@ -62,7 +74,7 @@ class Certification:
     credential_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     """Complete user profile for CV generation."""
 
@@ -93,61 +105,27 @@ class ProfileLoader:
             logger.warning(f"Profile file not found: {path}")
             return UserProfile()
 
-        with open(path) as f:
-            data = yaml.safe_load(f)
-
-        # Parse personal info
-        personal_data = data.get("personal", {})
-        personal = PersonalInfo(
-            name=personal_data.get("name", ""),
-            email=personal_data.get("email", ""),
-            phone=personal_data.get("phone", ""),
-            location=personal_data.get("location", ""),
-            linkedin=personal_data.get("linkedin", ""),
-            github=personal_data.get("github", ""),
-            website=personal_data.get("website", ""),
-        )
+        # A reload invalidates the cached context strings
+        self.__dict__.pop("context_string", None)
+        self.__dict__.pop("_sections", None)
+
+        cache_key = source_key(path, PROFILE_CACHE_VERSION)
+        cached = load_cached(path, cache_key)
+        if cached is not None:
+            self._profile = cached
+            logger.info(f"Loaded profile for: {cached.personal.name} (cached)")
+            return cached
 
-        # Parse experience
-        experience = []
-        for exp_data in data.get("experience", []):
-            exp = WorkExperience(
-                company=exp_data.get("company", ""),
-                title=exp_data.get("title", ""),
-                location=exp_data.get("location", ""),
-                start_date=exp_data.get("start_date", ""),
-                end_date=exp_data.get("end_date", ""),
-                description=exp_data.get("description", ""),
-                achievements=exp_data.get("achievements", []),
-                technologies=exp_data.get("technologies", []),
-            )
-            experience.append(exp)
-
-        # Parse education
-        education = []
-        for edu_data in data.get("education", []):
-            edu = Education(
-                institution=edu_data.get("institution", ""),
-                degree=edu_data.get("degree", ""),
-                field=edu_data.get("field", ""),
-                location=edu_data.get("location", ""),
-                graduation_date=edu_data.get("graduation_date", ""),
-                gpa=edu_data.get("gpa", ""),
-                achievements=edu_data.get("achievements", []),
-            )
-            education.append(edu)
-
-        # Parse certifications
-        certifications = []
-        for cert_data in data.get("certifications", []):
-            cert = Certification(
-                name=cert_data.get("name", ""),
-                issuer=cert_data.get("issuer", ""),
-                date=cert_data.get("date", ""),
-                expiry=cert_data.get("expiry", ""),
-                credential_id=cert_data.get("credential_id", ""),
-            )
-            certifications.append(cert)
+        # Whole-file bytes let libyaml decode UTF-8 and scan in one pass
+        data = yaml.load(path.read_bytes(), Loader=YamlLoader)
+
+        # Parse personal info, experience, education and certifications
+        personal = from_dict(PersonalInfo, data.get("personal", {}))
+        experience = [from_dict(WorkExperience, exp) for exp in data.get("experience", [])]
+        education = [from_dict(Education, edu) for edu in data.get("education", [])]
+        certifications = [
+            from_dict(Certification, cert) for cert in data.get("certifications", [])
+        ]
 
         self._profile = UserProfile(
             personal=personal,
@@ -160,6 +138,8 @@ class ProfileLoader:
             interests=data.get("interests", []),
         )
 
+        store_cached(path, cache_key, self._profile)
+
         logger.info(f"Loaded profile for: {personal.name}")
         return self._profile
 
@@ -170,65 +150,92 @@ class ProfileLoader:
             self._profile = self.load()
         return self._profile
 
+    @cached_property
+    def context_string(self) -> str:
+        """Profile as LLM context, built once and reused for every prompt."""
+        return self.to_context_string()
+
     def to_context_string(self) -> str:
         """Convert profile to string for LLM context."""
-        p = self.profile
+        return "\n".join(line for lines in self.context_sections().values() for line in lines)
 
-        sections = []
+    @cached_property
+    def _sections(self) -> dict[str, list[str]]:
+        return self.context_sections()
+
+    def section_context(self, *names: str) -> str:
+        """LLM context for only the named sections (see context_sections)."""
+        sections = self._sections
+        return "\n".join(line for name in names for line in sections[name]).strip()
+
+    def context_sections(self) -> dict[str, list[str]]:
+        """Profile context blocks grouped by section, in context-string order."""
+        p = self.profile
+        personal = p.personal
 
         # Personal info
-        sections.append(f"# {p.personal.name}")
-        sections.append(f"Email: {p.personal.email}")
-        sections.append(f"Phone: {p.personal.phone}")
-        sections.append(f"Location: {p.personal.location}")
-        if p.personal.linkedin:
-            sections.append(f"LinkedIn: {p.personal.linkedin}")
-        if p.personal.github:
-            sections.append(f"GitHub: {p.personal.github}")
-
-        # Summary
-        if p.summary:
-            sections.append(f"\n## Professional Summary\n{p.summary}")
-
-        # Experience
+        header = (
+            f"# {personal.name}\nEmail: {personal.email}\n"
+            f"Phone: {personal.phone}\nLocation: {personal.location}"
+        )
+        if personal.linkedin:
+            header += f"\nLinkedIn: {personal.linkedin}"
+        if personal.github:
+            header += f"\nGitHub: {personal.github}"
+
+        sections: dict[str, list[str]] = {
+            "personal": [header],
+            "summary": [f"\n## Professional Summary\n{p.summary}"] if p.summary else [],
+            "experience": [],
+            "education": [],
+            "certifications": [],
+            "skills": [],
+            "languages": [],
+        }
+
+        # Experience, one block per entry
         if p.experience:
-            sections.append("\n## Work Experience")
-            for exp in p.experience:
-                sections.append(f"\n### {exp.title} at {exp.company}")
-                sections.append(f"{exp.location} | {exp.start_date} - {exp.end_date}")
-                if exp.description:
-                    sections.append(exp.description)
-                if exp.achievements:
-                    sections.append("Achievements:")
-                    for ach in exp.achievements:
-                        sections.append(f"- {ach}")
-                if exp.technologies:
-                    sections.append(f"Technologies: {', '.join(exp.technologies)}")
+            sections["experience"] = ["\n## Work Experience", *map(_experience_block, p.experience)]
 
         # Education
         if p.education:
-            sections.append("\n## Education")
-            for edu in p.education:
-                sections.append(f"\n### {edu.degree} in {edu.field}")
-                sections.append(f"{edu.institution}, {edu.location}")
-                sections.append(f"Graduated: {edu.graduation_date}")
+            sections["education"] = ["\n## Education"] + [
+                f"\n### {edu.degree} in {edu.field}\n{edu.institution}, {edu.location}\n"
+                f"Graduated: {edu.graduation_date}"
+                for edu in p.education
+            ]
 
         # Certifications
         if p.certifications:
-            sections.append("\n## Certifications")
-            for cert in p.certifications:
-                sections.append(f"- {cert.name} ({cert.issuer}, {cert.date})")
+            sections["certifications"] = ["\n## Certifications"] + [
+                f"- {cert.name} ({cert.issuer}, {cert.date})" for cert in p.certifications
+            ]
 
         # Skills
         if p.skills:
-            sections.append("\n## Skills")
-            for category, skills in p.skills.items():
-                sections.append(f"**{category}:** {', '.join(skills)}")
+            sections["skills"] = ["\n## Skills"] + [
+                f"**{category}:** {', '.join(skills)}" for category, skills in p.skills.items()
+            ]
 
         # Languages
         if p.languages:
-            sections.append("\n## Languages")
-            for lang, level in p.languages.items():
-                sections.append(f"- {lang}: {level}")
-
-        return "\n".join(sections)
+            sections["languages"] = ["\n## Languages"] + [
+                f"- {lang}: {level}" for lang, level in p.languages.items()
+            ]
+
+        return sections
+
+
+def _experience_block(exp: WorkExperience) -> str:
+    """Context text for one work experience entry."""
+    block = (
+        f"\n### {exp.title} at {exp.company}\n"
+        f"{exp.location} | {exp.start_date} - {exp.end_date}"
+    )
+    if exp.description:
+        block += f"\n{exp.description}"
+    if exp.achievements:
+        block += "\nAchievements:\n" + "\n".join(f"- {ach}" for ach in exp.achievements)
+    if exp.technologies:
+        block += f"\nTechnologies: {', '.join(exp.technologies)}"
+    return block
@@ -3,15 +3,162 @@ RenderCV PDF Generator.
 Generates professional PDF CVs using RenderCV from tailored YAML content.
 """
 
+import asyncio
+import hashlib
+import os
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from html import escape
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 from loguru import logger
 
+# Cover letters need markdown and WeasyPrint; WeasyPrint raises OSError when
+# its native libraries (Pango, etc.) are missing
+try:
+    import markdown
+    from weasyprint import CSS, HTML
+    from weasyprint.text.fonts import FontConfiguration
+except (ImportError, OSError) as e:
+    _COVER_LETTER_IMPORT_ERROR: Optional[Exception] = e
+else:
+    _COVER_LETTER_IMPORT_ERROR = None
+
+# Render with RenderCV's Python API when installed, avoiding a CLI process
+# (interpreter start + RenderCV import) per PDF; otherwise fall back to the CLI
+try:
+    from rendercv.renderer.pdf_png import generate_pdf as rendercv_generate_pdf
+    from rendercv.renderer.typst import generate_typst as rendercv_generate_typst
+    from rendercv.schema.rendercv_model_builder import build_rendercv_dictionary_and_model
+except ImportError:
+    build_rendercv_dictionary_and_model = None
+
+# RenderCV's in-process pipeline isn't documented as thread-safe
+_RENDERCV_LOCK = threading.Lock()
+
+# Use libyaml's C emitter when available
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+# Shared pool for blocking PDF renders, sized to the CPU so concurrent jobs don't oversubscribe it
+_PDF_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="pdf")
+
+
+# Cover letter document; {body} is rendered Markdown, the other fields are escaped text
+COVER_LETTER_HTML = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+</head>
+<body>
+    <div class="header">
+        <h1>{name}</h1>
+        <p class="applying-for">Application for {title} at {company}</p>
+    </div>
+    <div class="content">
+        {body}
+    </div>
+</body>
+</html>"""
+
+# Cover letter stylesheet
+COVER_LETTER_CSS = """
+@page {
+    size: A4;
+    margin: 2.5cm;
+}
+
+body {
+    font-family: 'Georgia', 'Times New Roman', serif;
+    font-size: 11pt;
+    line-height: 1.6;
+    color: #333;
+}
+
+.header {
+    margin-bottom: 2em;
+    border-bottom: 1px solid #ccc;
+    padding-bottom: 1em;
+}
+
+.header h1 {
+    font-size: 18pt;
+    margin: 0;
+    color: #1a1a1a;
+}
+
+.applying-for {
+    color: #666;
+    font-style: italic;
+    margin-top: 0.5em;
+}
+
+.content p {
+    text-align: justify;
+    margin-bottom: 1em;
+}
+
+strong {
+    font-weight: 600;
+}
+"""
+
+
+@lru_cache(maxsize=1)
+def _cover_letter_css():
+    """Parse COVER_LETTER_CSS once and reuse the stylesheet for every cover letter."""
+    return CSS(string=COVER_LETTER_CSS)
+
+
+# Font configurations keep loaded fonts between cover letters; Pango font maps
+# aren't shared across threads, so each PDF worker thread gets its own
+_fonts = threading.local()
+
+
+def _cover_letter_fonts() -> "FontConfiguration":
+    """FontConfiguration for cover letters rendered on the current thread."""
+    font_config = getattr(_fonts, "config", None)
+    if font_config is None:
+        font_config = _fonts.config = FontConfiguration()
+    return font_config
+
+
+class _FilenameTable(dict):
+    """
+    str.translate table replacing characters other than letters, digits, "-"
+    and "_" (Unicode-aware, like str.isalnum) with "_".
+    Characters missing from the table are classified on first sight.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        self[codepoint] = value = char if char.isalnum() or char in "-_" else "_"
+        return value
+
+
+_FILENAME_TABLE = _FilenameTable()
+for _codepoint in range(256):
+    _FILENAME_TABLE[_codepoint]
+
+
+@lru_cache(maxsize=1)
+def _render_pool() -> ProcessPoolExecutor:
+    """Worker processes for batch CV renders, started on first use and kept warm."""
+    return ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+def _generate_pdf_in_worker(
+    output_dir: Path, cv_data: dict[str, Any], job_id: str, company: str
+) -> "PDFGenerationResult":
+    """Render one CV in a worker process."""
+    return RenderCVGenerator(output_dir).generate_pdf(cv_data, job_id, company)
+
 
 @dataclass
 class PDFGenerationResult:
@@ -31,12 +178,67 @@ class RenderCVGenerator:
 
     def _sanitize_filename(self, text: str) -> str:
         """Sanitize text for use in filenames."""
-        return "".join(c if c.isalnum() or c in "-_" else "_" for c in text)
+        return text.translate(_FILENAME_TABLE)
+
+    def _write_yaml(self, cv_data: dict[str, Any], output_path: Path) -> bool:
+        """
+        Write CV data to YAML file atomically.
+        Leaves an identical existing file untouched; returns whether it was written.
+        """
+        content = yaml.dump(
+            cv_data, Dumper=YamlDumper,
+            default_flow_style=False, allow_unicode=True, sort_keys=False,
+        ).encode("utf-8")
+
+        try:
+            if output_path.read_bytes() == content:
+                return False
+        except FileNotFoundError:
+            pass
+
+        tmp_path = output_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, output_path)
+        return True
+
+    def _find_rendered_pdfs(self, job_output_dir: Path, final_pdf_path: Path) -> list[Path]:
+        """
+        Locate PDFs written by the RenderCV CLI.
+        Scans rendercv_output first and only searches the whole job directory
+        if it has none, skipping our earlier CV and the cover letter there.
+        """
+        try:
+            with os.scandir(job_output_dir / "rendercv_output") as entries:
+                pdf_files = [
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith(".pdf") and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            pdf_files = []
+
+        return pdf_files or [
+            path for path in job_output_dir.glob("**/*.pdf")
+            if path != final_pdf_path and not path.name.startswith("cover_letter_")
+        ]
+
+    def _render_in_process(self, yaml_path: Path, pdf_path: Path) -> Path:
+        """Render a RenderCV YAML file to pdf_path through RenderCV's Python API."""
+        with _RENDERCV_LOCK:
+            _, model = build_rendercv_dictionary_and_model(
+                yaml_path,
+                typst_path=pdf_path.with_suffix(".typ"),
+                pdf_path=pdf_path,
+                dont_generate_png=True,
+                dont_generate_markdown=True,
+                dont_generate_html=True,
+            )
+            rendered = rendercv_generate_pdf(model, rendercv_generate_typst(model))
 
-    def _write_yaml(self, cv_data: dict[str, Any], output_path: Path) -> None:
-        """Write CV data to YAML file."""
-        with open(output_path, "w") as f:
-            yaml.dump(cv_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        if rendered is None:
+            raise RuntimeError("RenderCV produced no PDF")
+        if rendered != pdf_path:
+            rendered.rename(pdf_path)
+        return pdf_path
 
     def generate_pdf(
         self,
@@ -64,9 +266,27 @@ class RenderCVGenerator:
 
         # Write tailored YAML
         yaml_path = job_output_dir / f"{base_filename}.yaml"
-        self._write_yaml(cv_data, yaml_path)
+        final_pdf_path = job_output_dir / f"{base_filename}.pdf"
+        if not self._write_yaml(cv_data, yaml_path) and final_pdf_path.exists():
+            # Same CV as an earlier successful render: reuse its PDF
+            logger.info(f"CV unchanged for {company} (job: {job_id[:8]}), reusing {final_pdf_path}")
+            return PDFGenerationResult(
+                success=True,
+                pdf_path=final_pdf_path,
+                yaml_path=yaml_path,
+            )
 
         try:
+            if build_rendercv_dictionary_and_model is not None:
+                logger.info(f"Rendering CV for {company} (job: {job_id[:8]})")
+                pdf_path = self._render_in_process(yaml_path, final_pdf_path)
+                logger.info(f"Generated PDF: {pdf_path}")
+                return PDFGenerationResult(
+                    success=True,
+                    pdf_path=pdf_path,
+                    yaml_path=yaml_path,
+                )
+
             # Run RenderCV
             logger.info(f"Running RenderCV for {company} (job: {job_id[:8]})")
 
@@ -78,13 +298,15 @@ class RenderCVGenerator:
                     "--output-folder-name",
                     str(job_output_dir),
                 ],
-                capture_output=True,
-                text=True,
+                # One pipe for both streams (RenderCV reports errors on stdout);
+                # output is only decoded when the render fails
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 timeout=120,  # 2 minute timeout
             )
 
             if result.returncode != 0:
-                error_msg = result.stderr or result.stdout or "Unknown error"
+                error_msg = result.stdout.decode("utf-8", "replace").strip() or "Unknown error"
                 logger.error(f"RenderCV failed: {error_msg}")
                 return PDFGenerationResult(
                     success=False,
@@ -93,7 +315,7 @@ class RenderCVGenerator:
                 )
 
             # Find generated PDF (RenderCV puts output in rendercv_output subdirectory)
-            pdf_files = list(job_output_dir.glob("**/*.pdf"))
+            pdf_files = self._find_rendered_pdfs(job_output_dir, final_pdf_path)
             if not pdf_files:
                 return PDFGenerationResult(
                     success=False,
@@ -105,7 +327,6 @@ class RenderCVGenerator:
             pdf_path = pdf_files[0]
 
             # Rename to our standard naming convention
-            final_pdf_path = job_output_dir / f"{base_filename}.pdf"
             if pdf_path != final_pdf_path:
                 pdf_path.rename(final_pdf_path)
                 pdf_path = final_pdf_path
@@ -140,6 +361,40 @@ class RenderCVGenerator:
                 error=str(e),
             )
 
+    def generate_pdfs(self, items: list[dict[str, Any]]) -> list[PDFGenerationResult]:
+        """
+        Render many CVs in parallel worker processes.
+        Each render is independent, so a batch scales with the number of cores.
+
+        Args:
+            items: Dicts with the generate_pdf arguments (cv_data, job_id, company)
+
+        Returns:
+            PDFGenerationResult per item, in input order
+        """
+        if len(items) <= 1:
+            return [self.generate_pdf(**item) for item in items]
+
+        pool = _render_pool()
+        futures = [
+            pool.submit(
+                _generate_pdf_in_worker,
+                self.output_dir, item["cv_data"], item["job_id"], item["company"],
+            )
+            for item in items
+        ]
+
+        results = []
+        for item, future in zip(items, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"PDF generation failed for job {item['job_id'][:8]}: {e}")
+                results.append(PDFGenerationResult(success=False, error=str(e)))
+
+        logger.info(f"Generated {sum(r.success for r in results)}/{len(items)} CV PDFs")
+        return results
+
     def generate_cover_letter_pdf(
         self,
         cover_letter: str,
@@ -162,10 +417,11 @@ class RenderCVGenerator:
         Returns:
             Path to generated PDF or None on failure
         """
-        try:
-            import markdown
-            from weasyprint import CSS, HTML
+        if _COVER_LETTER_IMPORT_ERROR is not None:
+            logger.error(f"Cover letter PDF generation unavailable: {_COVER_LETTER_IMPORT_ERROR}")
+            return None
 
+        try:
             safe_company = self._sanitize_filename(company)
             base_filename = f"cover_letter_{safe_company}_{job_id[:8]}"
 
@@ -173,71 +429,39 @@ class RenderCVGenerator:
             job_output_dir = self.output_dir / f"cv_{safe_company}_{job_id[:8]}"
             job_output_dir.mkdir(parents=True, exist_ok=True)
 
+            # A marker named after the inputs' hash records which letter the PDF holds
+            pdf_path = job_output_dir / f"{base_filename}.pdf"
+            key = hashlib.blake2b(
+                f"{candidate_name}\0{job_title}\0{company}\0{cover_letter}\0{COVER_LETTER_CSS}".encode(),
+                digest_size=8,
+            ).hexdigest()
+            marker = job_output_dir / f"{base_filename}.{key}.hash"
+            if marker.exists() and pdf_path.exists():
+                logger.info(f"Cover letter unchanged for {company} (job: {job_id[:8]}), reusing {pdf_path}")
+                return pdf_path
+
             # Convert markdown to HTML
             html_content = markdown.markdown(cover_letter)
 
-            # Wrap in document structure
-            html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-</head>
-<body>
-    <div class="header">
-        <h1>{candidate_name}</h1>
-        <p class="applying-for">Application for {job_title} at {company}</p>
-    </div>
-    <div class="content">
-        {html_content}
-    </div>
-</body>
-</html>"""
-
-            # CSS styling
-            css = CSS(string="""
-@page {
-    size: A4;
-    margin: 2.5cm;
-}
-
-body {
-    font-family: 'Georgia', 'Times New Roman', serif;
-    font-size: 11pt;
-    line-height: 1.6;
-    color: #333;
-}
-
-.header {
-    margin-bottom: 2em;
-    border-bottom: 1px solid #ccc;
-    padding-bottom: 1em;
-}
-
-.header h1 {
-    font-size: 18pt;
-    margin: 0;
-    color: #1a1a1a;
-}
+            # Wrap in document structure (header text is plain, the body is HTML)
+            html = COVER_LETTER_HTML.format_map({
+                "name": escape(candidate_name),
+                "title": escape(job_title),
+                "company": escape(company),
+                "body": html_content,
+            })
 
-.applying-for {
-    color: #666;
-    font-style: italic;
-    margin-top: 0.5em;
-}
-
-.content p {
-    text-align: justify;
-    margin-bottom: 1em;
-}
-
-strong {
-    font-weight: 600;
-}
-""")
+            # Drop markers of earlier letters first so a failed render never leaves one behind
+            for stale in job_output_dir.glob(f"{base_filename}.*.hash"):
+                stale.unlink(missing_ok=True)
 
             # Generate PDF
-            pdf_path = job_output_dir / f"{base_filename}.pdf"
-            HTML(string=html).write_pdf(pdf_path, stylesheets=[css])
+            HTML(string=html).write_pdf(
+                pdf_path,
+                stylesheets=[_cover_letter_css()],
+                font_config=_cover_letter_fonts(),
+            )
+            marker.write_bytes(b"")
 
             logger.info(f"Generated cover letter PDF: {pdf_path}")
             return pdf_path
@@ -245,3 +469,38 @@ strong {
         except Exception as e:
             logger.error(f"Cover letter PDF generation failed: {e}")
             return None
+
+    async def generate_application_pdfs(
+        self,
+        cv_data: dict[str, Any],
+        cover_letter: str,
+        job_id: str,
+        company: str,
+        job_title: str,
+        candidate_name: str,
+    ) -> tuple[PDFGenerationResult, Optional[Path]]:
+        """
+        Generate the CV PDF and cover letter PDF for a job concurrently.
+        Both renders block, so they run in the shared PDF thread pool.
+
+        Returns:
+            Tuple of (CV PDFGenerationResult, cover letter PDF path or None)
+        """
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(
+            loop.run_in_executor(
+                _PDF_EXECUTOR,
+                partial(self.generate_pdf, cv_data=cv_data, job_id=job_id, company=company),
+            ),
+            loop.run_in_executor(
+                _PDF_EXECUTOR,
+                partial(
+                    self.generate_cover_letter_pdf,
+                    cover_letter=cover_letter,
+                    job_id=job_id,
+                    company=company,
+                    job_title=job_title,
+                    candidate_name=candidate_name,
+                ),
+            ),
+        )
@@ -0,0 +1,189 @@
+"""
+ReportLab PDF renderer for simple Markdown documents.
+Draws headings, paragraphs, lists, code and tables directly as ReportLab
+flowables, skipping WeasyPrint's HTML/CSS layout engine.
+"""
+
+from functools import lru_cache
+from html import escape
+from io import BytesIO
+
+from markdown_it import MarkdownIt
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_JUSTIFY
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
+from reportlab.lib.units import cm
+from reportlab.platypus import (
+    Flowable,
+    ListFlowable,
+    ListItem,
+    Paragraph,
+    Preformatted,
+    SimpleDocTemplate,
+    Spacer,
+    Table,
+    TableStyle,
+)
+
+ACCENT = colors.HexColor("#2563eb")
+TEXT = colors.HexColor("#333333")
+HEADING = colors.HexColor("#1a1a1a")
+
+_MARKDOWN = MarkdownIt("commonmark").enable("table")
+
+
+@lru_cache(maxsize=1)
+def _styles() -> StyleSheet1:
+    """Paragraph styles matching PDF_CSS in generator.pdf."""
+    styles = getSampleStyleSheet()
+    body = ParagraphStyle(
+        "Body", parent=styles["Normal"], fontName="Helvetica",
+        fontSize=11, leading=16.5, textColor=TEXT, spaceAfter=5.5,
+    )
+    styles.add(body)
+    styles.add(ParagraphStyle(
+        "CoverLetterBody", parent=body, alignment=TA_JUSTIFY, spaceAfter=11,
+    ))
+    styles.add(ParagraphStyle(
+        "H1", parent=body, fontName="Helvetica-Bold", fontSize=24, leading=29,
+        textColor=HEADING, spaceAfter=10,
+    ))
+    styles.add(ParagraphStyle(
+        "H2", parent=body, fontName="Helvetica-Bold", fontSize=14, leading=17,
+        textColor=ACCENT, spaceBefore=17, spaceAfter=7,
+    ))
+    styles.add(ParagraphStyle(
+        "H3", parent=body, fontName="Helvetica-Bold", fontSize=12, leading=15,
+        textColor=HEADING, spaceBefore=10, spaceAfter=4,
+    ))
+    styles.add(ParagraphStyle(
+        "CodeBlock", parent=body, fontName="Courier", fontSize=9, leading=12,
+    ))
+    return styles
+
+
+def _inline(token) -> str:
+    """Convert an inline token to ReportLab paragraph markup."""
+    parts = []
+    for child in token.children or ():
+        kind = child.type
+        if kind == "text":
+            parts.append(escape(child.content, quote=False))
+        elif kind == "code_inline":
+            parts.append(f'<font face="Courier">{escape(child.content, quote=False)}</font>')
+        elif kind == "strong_open":
+            parts.append("<b>")
+        elif kind == "strong_close":
+            parts.append("</b>")
+        elif kind == "em_open":
+            parts.append("<i>")
+        elif kind == "em_close":
+            parts.append("</i>")
+        elif kind == "link_open":
+            href = escape(child.attrs.get("href", ""))
+            parts.append(f'<a href="{href}" color="#2563eb">')
+        elif kind == "link_close":
+            parts.append("</a>")
+        elif kind == "softbreak":
+            parts.append(" ")
+        elif kind == "hardbreak":
+            parts.append("<br/>")
+    return "".join(parts)
+
+
+def _flowables(tokens: list, start: int, stop_type: str | None, body: ParagraphStyle) -> tuple[list[Flowable], int]:
+    """Build flowables from tokens[start:] until stop_type closes; returns (flowables, next index)."""
+    styles = _styles()
+    flowables: list[Flowable] = []
+    i = start
+    while i < len(tokens):
+        token = tokens[i]
+        kind = token.type
+
+        if kind == stop_type:
+            return flowables, i + 1
+
+        if kind == "heading_open":
+            style = styles[token.tag.upper()] if token.tag in ("h1", "h2", "h3") else styles["H3"]
+            text = _inline(tokens[i + 1])
+            flowables.append(Paragraph(text.upper() if token.tag == "h2" else text, style))
+            i += 3
+        elif kind == "paragraph_open":
+            flowables.append(Paragraph(_inline(tokens[i + 1]), body))
+            i += 3
+        elif kind in ("bullet_list_open", "ordered_list_open"):
+            close = kind.replace("_open", "_close")
+            items, i = _list_items(tokens, i + 1, close, body)
+            flowables.append(ListFlowable(
+                items,
+                bulletType="1" if kind == "ordered_list_open" else "bullet",
+                leftIndent=18,
+                bulletFontSize=8 if kind == "bullet_list_open" else body.fontSize,
+            ))
+        elif kind in ("fence", "code_block"):
+            flowables.append(Preformatted(token.content.rstrip("\n"), styles["CodeBlock"]))
+            i += 1
+        elif kind == "hr":
+            flowables.append(Spacer(1, 0.5 * cm))
+            i += 1
+        elif kind == "table_open":
+            table, i = _table(tokens, i + 1, body)
+            flowables.append(table)
+        else:
+            i += 1
+
+    return flowables, i
+
+
+def _list_items(tokens: list, start: int, stop_type: str, body: ParagraphStyle) -> tuple[list[ListItem], int]:
+    """Build list items until the list closes."""
+    items = []
+    i = start
+    while i < len(tokens) and tokens[i].type != stop_type:
+        if tokens[i].type == "list_item_open":
+            content, i = _flowables(tokens, i + 1, "list_item_close", body)
+            items.append(ListItem(content))
+        else:
+            i += 1
+    return items, i + 1
+
+
+def _table(tokens: list, start: int, body: ParagraphStyle) -> tuple[Table, int]:
+    """Build a table until table_close; the first row is the header."""
+    rows: list[list[Paragraph]] = []
+    i = start
+    while tokens[i].type != "table_close":
+        token = tokens[i]
+        if token.type == "tr_open":
+            rows.append([])
+        elif token.type == "inline":
+            rows[-1].append(Paragraph(_inline(token), body))
+        i += 1
+
+    table = Table(rows, hAlign="LEFT")
+    table.setStyle(TableStyle([
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("LINEBELOW", (0, 0), (-1, 0), 0.5, ACCENT),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ]))
+    return table, i + 1
+
+
+def render_markdown_pdf(content: str, is_cover_letter: bool = False) -> bytes:
+    """Render Markdown content to PDF bytes."""
+    styles = _styles()
+    body = styles["CoverLetterBody"] if is_cover_letter else styles["Body"]
+    flowables, _ = _flowables(_MARKDOWN.parse(content), 0, None, body)
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        leftMargin=2.5 * cm,
+        rightMargin=2.5 * cm,
+        topMargin=2 * cm,
+        bottomMargin=2 * cm,
+    )
+    doc.build(flowables)
+    return buffer.getvalue()
@@ -10,8 +10,17 @@ from typing import Optional
 import yaml
 from loguru import logger
 
+from shared.dataclass_loader import from_dict
+from shared.file_cache import load_cached, source_key, store_cached
 
-@dataclass
+# Use libyaml's C loader when available
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bump when the CV dataclasses change so stale pickled CVs are ignored
+CV_CACHE_VERSION = 2
+
+
+@dataclass(slots=True)
 class CertificationInfo:
     """Certification entry."""
 
@@ -21,7 +30,7 @@ class CertificationInfo:
     credential_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ExperienceEntry:
     """Work experience entry."""
 
@@ -38,7 +47,7 @@ class ExperienceEntry:
     technologies: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CVData:
     """Complete CV data structure."""
 
@@ -61,6 +70,8 @@ class CVLoader:
     def __init__(self, cv_path: Optional[Path] = None):
         self.cv_path = cv_path
         self._cv_data: Optional[CVData] = None
+        self._context_string: Optional[str] = None
+        self._compact_context: Optional[str] = None
 
     def load(self, path: Optional[Path] = None) -> CVData:
         """Load CV from YAML file. Supports both legacy and RenderCV formats."""
@@ -71,44 +82,34 @@ class CVLoader:
         if not path.exists():
             raise FileNotFoundError(f"CV file not found: {path}")
 
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        # A reload invalidates the cached context string
+        self._context_string = None
+        self._compact_context = None
+
+        cache_key = source_key(path, CV_CACHE_VERSION)
+        cached = load_cached(path, cache_key)
+        if cached is not None:
+            self._cv_data = cached
+            logger.info(f"Loaded CV for: {cached.name} (cached)")
+            return cached
+
+        # Whole-file bytes let libyaml decode UTF-8 and scan in one pass
+        data = yaml.load(path.read_bytes(), Loader=YamlLoader)
 
         # Detect format: RenderCV uses "cv" as root key
         if "cv" in data:
-            return self._load_rendercv_format(data)
+            cv_data = self._load_rendercv_format(data)
+            store_cached(path, cache_key, cv_data)
+            return cv_data
 
         # Parse personal info (legacy format)
         personal = data.get("personal", {})
 
-        # Parse certifications
+        # Parse certifications and experience
         certifications = [
-            CertificationInfo(
-                name=cert.get("name", ""),
-                issuer=cert.get("issuer", ""),
-                date=cert.get("date", ""),
-                credential_id=cert.get("credential_id", ""),
-            )
-            for cert in data.get("certifications", [])
-        ]
-
-        # Parse experience
-        experience = [
-            ExperienceEntry(
-                company=exp.get("company", ""),
-                title=exp.get("title", ""),
-                employment_type=exp.get("employment_type", ""),
-                location=exp.get("location", ""),
-                start_date=exp.get("start_date", ""),
-                end_date=exp.get("end_date", ""),
-                duration=exp.get("duration", ""),
-                achievements=exp.get("achievements", []),
-                responsibilities=exp.get("responsibilities", []),
-                project_highlights=exp.get("project_highlights", []),
-                technologies=exp.get("technologies", []),
-            )
-            for exp in data.get("experience", [])
+            from_dict(CertificationInfo, cert) for cert in data.get("certifications", [])
         ]
+        experience = [from_dict(ExperienceEntry, exp) for exp in data.get("experience", [])]
 
         self._cv_data = CVData(
             name=personal.get("name", ""),
@@ -124,6 +125,8 @@ class CVLoader:
             matching_hints=data.get("matching_hints", {}),
         )
 
+        store_cached(path, cache_key, self._cv_data)
+
         logger.info(f"Loaded CV for: {self._cv_data.name}")
         return self._cv_data
 
@@ -132,15 +135,15 @@ class CVLoader:
         cv = data.get("cv", {})
         sections = cv.get("sections", {})
 
-        # Parse certifications from RenderCV format
-        certifications = [
-            CertificationInfo(
+        # Parse certifications from RenderCV format ("Issuer, ..., Date" details)
+        certifications = []
+        for cert in sections.get("certifications", []):
+            details = cert.get("details") or ""
+            certifications.append(CertificationInfo(
                 name=cert.get("label", ""),
-                issuer=cert.get("details", "").split(",")[0] if cert.get("details") else "",
-                date=cert.get("details", "").split(",")[-1].strip() if cert.get("details") else "",
-            )
-            for cert in sections.get("certifications", [])
-        ]
+                issuer=details.partition(",")[0],
+                date=details.rpartition(",")[2].strip(),
+            ))
 
         # Parse experience from RenderCV format
         experience = [
@@ -207,19 +210,19 @@ class CVLoader:
         return self._cv_data
 
     def to_context_string(self) -> str:
-        """Convert CV to string for LLM context."""
+        """Convert CV to string for LLM context. Built once per load."""
+        if self._context_string is not None:
+            return self._context_string
+
         cv = self.cv_data
-        sections = []
 
         # Header
-        sections.append(f"# {cv.name}")
-        sections.append(f"**{cv.headline}**")
-        sections.append(f"Location: {cv.location}")
+        sections = [f"# {cv.name}", f"**{cv.headline}**", f"Location: {cv.location}"]
 
         # Languages
         if cv.languages:
-            langs = [f"{lang['language']} ({lang['proficiency']})" for lang in cv.languages]
-            sections.append(f"Languages: {', '.join(langs)}")
+            langs = ", ".join(f"{lang['language']} ({lang['proficiency']})" for lang in cv.languages)
+            sections.append(f"Languages: {langs}")
 
         # Summary
         if cv.summary:
@@ -227,64 +230,128 @@ class CVLoader:
 
         # Core Competencies
         if cv.core_competencies:
-            sections.append("\n## Core Competencies")
-            sections.append(", ".join(cv.core_competencies))
+            sections.append(f"\n## Core Competencies\n{', '.join(cv.core_competencies)}")
 
         # Technical Skills
         if cv.technical_skills:
             sections.append("\n## Technical Skills")
-            for category, skills in cv.technical_skills.items():
-                category_name = category.replace("_", " ").title()
-                sections.append(f"**{category_name}:** {', '.join(skills)}")
+            sections.extend(
+                f"**{category.replace('_', ' ').title()}:** {', '.join(skills)}"
+                for category, skills in cv.technical_skills.items()
+            )
 
         # Certifications
         if cv.certifications:
             sections.append("\n## Certifications")
-            for cert in cv.certifications:
-                cert_line = f"- {cert.name} ({cert.issuer})"
-                if cert.date:
-                    cert_line += f" - {cert.date}"
-                sections.append(cert_line)
+            sections.extend(
+                f"- {cert.name} ({cert.issuer}) - {cert.date}" if cert.date
+                else f"- {cert.name} ({cert.issuer})"
+                for cert in cv.certifications
+            )
 
-        # Experience
+        # Experience, one block per entry
         if cv.experience:
             sections.append("\n## Professional Experience")
-            for exp in cv.experience:
-                sections.append(f"\n### {exp.title} at {exp.company}")
-                if exp.location:
-                    sections.append(f"Location: {exp.location}")
-                if exp.duration:
-                    sections.append(f"Duration: {exp.duration}")
-                elif exp.start_date:
-                    sections.append(f"Period: {exp.start_date} - {exp.end_date}")
-
-                if exp.achievements:
-                    sections.append("**Achievements:**")
-                    for achievement in exp.achievements:
-                        sections.append(f"- {achievement}")
-
-                if exp.responsibilities:
-                    sections.append("**Responsibilities:**")
-                    for resp in exp.responsibilities:
-                        sections.append(f"- {resp}")
-
-                if exp.project_highlights:
-                    sections.append("**Project Highlights:**")
-                    for highlight in exp.project_highlights:
-                        sections.append(f"- {highlight}")
-
-                if exp.technologies:
-                    sections.append(f"**Technologies:** {', '.join(exp.technologies)}")
+            sections.extend(map(_experience_block, cv.experience))
 
         # Education
         if cv.education:
             sections.append("\n## Education")
-            for edu in cv.education:
-                edu_line = f"- {edu.get('degree', '')} - {edu.get('institution', '')}"
-                if edu.get("location"):
-                    edu_line += f", {edu['location']}"
-                if edu.get("years"):
-                    edu_line += f" ({edu['years']})"
-                sections.append(edu_line)
-
-        return "\n".join(sections)
+            sections.extend(map(_education_line, cv.education))
+
+        self._context_string = "\n".join(sections)
+        return self._context_string
+
+    def to_compact_context(self) -> str:
+        """
+        Convert CV to a compact one-field-per-line string for LLM context.
+        Keeps the scoring facts (skills, certifications, roles, periods, technologies)
+        and leaves out Markdown scaffolding and per-role bullets. Built once per load.
+        """
+        if self._compact_context is not None:
+            return self._compact_context
+
+        cv = self.cv_data
+
+        lines = [f"NAME: {cv.name}", f"HEADLINE: {cv.headline}", f"LOCATION: {cv.location}"]
+        if cv.languages:
+            lines.append("LANGUAGES: " + ", ".join(
+                f"{lang['language']} ({lang['proficiency']})" for lang in cv.languages
+            ))
+        if cv.summary:
+            lines.append(f"SUMMARY: {' '.join(cv.summary.split())}")
+        if cv.core_competencies:
+            lines.append(f"COMPETENCIES: {'; '.join(cv.core_competencies)}")
+        lines.extend(
+            f"SKILLS {category.replace('_', ' ').upper()}: {', '.join(skills)}"
+            for category, skills in cv.technical_skills.items()
+        )
+        if cv.certifications:
+            lines.append("CERTS: " + "; ".join(
+                f"{cert.name} ({cert.issuer}, {cert.date})" if cert.date
+                else f"{cert.name} ({cert.issuer})"
+                for cert in cv.certifications
+            ))
+        lines.extend(map(_compact_experience, cv.experience))
+        if cv.education:
+            lines.append("EDUCATION: " + "; ".join(
+                map(_compact_education, cv.education)
+            ))
+
+        self._compact_context = "\n".join(lines)
+        return self._compact_context
+
+
+def _compact_experience(exp: ExperienceEntry) -> str:
+    """Compact context line for one experience entry."""
+    line = f"JOB: {exp.title} @ {exp.company}"
+    period = exp.duration or (f"{exp.start_date}-{exp.end_date}" if exp.start_date else "")
+    if period:
+        line += f" | {period}"
+    if exp.location:
+        line += f" | {exp.location}"
+    if exp.technologies:
+        line += f" | TECH: {', '.join(exp.technologies)}"
+    return line
+
+
+def _compact_education(edu: dict) -> str:
+    """Compact context text for one education entry."""
+    text = ", ".join(filter(None, (edu.get("degree"), edu.get("institution"), edu.get("location"))))
+    return f"{text} ({edu['years']})" if edu.get("years") else text
+
+
+def _bullets(title: str, items: list) -> str:
+    """Titled bullet list, as context lines."""
+    return f"\n{title}\n" + "\n".join(f"- {item}" for item in items)
+
+
+def _experience_block(exp: ExperienceEntry) -> str:
+    """Context text for one experience entry."""
+    block = f"\n### {exp.title} at {exp.company}"
+    if exp.location:
+        block += f"\nLocation: {exp.location}"
+    if exp.duration:
+        block += f"\nDuration: {exp.duration}"
+    elif exp.start_date:
+        block += f"\nPeriod: {exp.start_date} - {exp.end_date}"
+
+    if exp.achievements:
+        block += _bullets("**Achievements:**", exp.achievements)
+    if exp.responsibilities:
+        block += _bullets("**Responsibilities:**", exp.responsibilities)
+    if exp.project_highlights:
+        block += _bullets("**Project Highlights:**", exp.project_highlights)
+    if exp.technologies:
+        block += f"\n**Technologies:** {', '.join(exp.technologies)}"
+    return block
+
+
+def _education_line(edu: dict) -> str:
+    """Context line for one education entry."""
+    line = f"- {edu.get('degree', '')} - {edu.get('institution', '')}"
+    if edu.get("location"):
+        line += f", {edu['location']}"
+    if edu.get("years"):
+        line += f" ({edu['years']})"
+    return line
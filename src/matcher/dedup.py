@@ -0,0 +1,53 @@
+"""
+Near-duplicate detection for job postings.
+Reposts and cross-board copies of a posting get one LLM match per run.
+"""
+
+import hashlib
+import re
+from collections import Counter
+from typing import Optional
+
+# Postings whose SimHashes differ in at most this many of 64 bits are duplicates
+MAX_DISTANCE = 3
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of the text's words, weighted by frequency."""
+    counts = Counter(_WORD_RE.findall(text.lower()))
+    half = sum(counts.values()) / 2
+    # Word hashes as bit strings so each bit column is summed in one pass
+    rows = [
+        (f"{int.from_bytes(hashlib.blake2b(word.encode(), digest_size=8).digest()):064b}", count)
+        for word, count in counts.items()
+    ]
+    fingerprint = 0
+    for column in range(64):
+        fingerprint <<= 1
+        if sum(count for bits, count in rows if bits[column] == "1") > half:
+            fingerprint |= 1
+    return fingerprint
+
+
+class NearDuplicateIndex:
+    """Finds postings with the same title and a near-identical description."""
+
+    def __init__(self, max_distance: int = MAX_DISTANCE):
+        self.max_distance = max_distance
+        # Normalized title -> [(SimHash, representative id)]
+        self._entries: dict[str, list[tuple[int, str]]] = {}
+
+    def find_or_add(self, item_id: str, title: str, description: str) -> Optional[str]:
+        """
+        Return the id of an earlier near-duplicate posting, or None after
+        recording this one as a new representative.
+        """
+        fingerprint = simhash(description)
+        entries = self._entries.setdefault(" ".join(title.lower().split()), [])
+        for other, representative in entries:
+            if (fingerprint ^ other).bit_count() <= self.max_distance:
+                return representative
+        entries.append((fingerprint, item_id))
+        return None
@@ -2,21 +2,40 @@
 LLM-based job-CV matching using OpenAI.
 """
 
+import asyncio
+import hashlib
 import json
-import sys
+import math
+import re
+import sqlite3
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Optional
 
 from loguru import logger
 from openai import AsyncOpenAI
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from shared.config import Settings, get_settings
+from shared.openai_client import get_openai_client
 
 from .cv_loader import CVLoader
+from .semantic_cache import SemanticMatchCache
+from .token_budget import TokenBudget, estimate_tokens
+
+# Use orjson's C parser when available; its JSONDecodeError subclasses json's
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Salvage {score, reasoning} from responses that are not valid JSON (truncated, stray text)
+_SCORE_RE = re.compile(r'"score"\s*:\s*"?(\d+)')
+_REASONING_RE = re.compile(r'"reasoning"\s*:\s*("(?:[^"\\]|\\.)*")', re.S)
+
+# Stay well inside the embedding model's 8k-token input limit
+EMBED_MAX_CHARS = 20_000
+
+# Keep each batched embedding request under the endpoint's per-request token limit
+EMBED_BATCH_MAX_CHARS = 600_000
 
 
 @dataclass
@@ -48,9 +67,25 @@ Consider:
 - Certification relevance
 - Industry experience
 - Seniority level match
-- Location/language requirements if specified
+- Location/language requirements if specified"""
+
+# Strict structured output: the API guarantees a 1-5 score and a reasoning string
+MATCH_SCHEMA = {
+    "name": "match",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "score": {"type": "integer", "enum": [1, 2, 3, 4, 5]},
+            "reasoning": {"type": "string", "description": "2-3 sentence explanation"},
+        },
+        "required": ["score", "reasoning"],
+        "additionalProperties": False,
+    },
+}
 
-IMPORTANT: Respond ONLY with valid JSON in the exact format specified. No other text."""
+# A score and 2-3 sentences of reasoning fit comfortably
+MATCH_MAX_TOKENS = 200
 
 
 class LLMMatcher:
@@ -64,35 +99,157 @@ class LLMMatcher:
         self.settings = settings or get_settings()
         self.cv_loader = cv_loader
         self._client: Optional[AsyncOpenAI] = None
+        self._semantic_cache: Optional[SemanticMatchCache] = None
+        self._semantic_cache_enabled = self.settings.matcher_semantic_cache
+        self._cv_hash: tuple[str, str] = ("", "")
+        self.token_budget = (
+            TokenBudget(self.settings.matcher_tokens_per_minute)
+            if self.settings.matcher_tokens_per_minute > 0
+            else None
+        )
+        # Prompt tokens sent and served from OpenAI's prompt cache, for hit-rate logging
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
 
     @property
     def client(self) -> AsyncOpenAI:
-        """Get or create OpenAI client."""
+        """Get the shared OpenAI client."""
         if self._client is None:
-            self._client = AsyncOpenAI(
-                api_key=self.settings.openai_api_key.get_secret_value()
-            )
+            self._client = get_openai_client(self.settings.openai_api_key.get_secret_value())
         return self._client
 
+    @property
+    def semantic_cache(self) -> Optional[SemanticMatchCache]:
+        """Get the match cache stored next to the CV, or None when disabled or unavailable."""
+        if self._semantic_cache is None and self._semantic_cache_enabled:
+            self._semantic_cache_enabled = False
+            cv_path = self.cv_loader.cv_path
+            if cv_path is None:
+                return None
+            path = cv_path.with_suffix(cv_path.suffix + ".match_cache.sqlite3")
+            try:
+                self._semantic_cache = SemanticMatchCache(
+                    path, max_entries=self.settings.matcher_semantic_cache_size
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Semantic match cache disabled, cannot open {path}: {e}")
+        return self._semantic_cache
+
+    def _hash_cv(self, cv_context: str) -> str:
+        """Hash the CV context; cached matches only apply to the same CV, prompt and model."""
+        if self._cv_hash[0] != cv_context:
+            digest = hashlib.sha256(
+                f"{self.settings.openai_model_mini}\0{SYSTEM_PROMPT}\0{cv_context}".encode()
+            ).hexdigest()[:16]
+            self._cv_hash = (cv_context, digest)
+        return self._cv_hash[1]
+
+    async def embed_jobs(self, job_descriptions: list[str]) -> list[Optional[list[float]]]:
+        """
+        Embed job descriptions as unit-length vectors with as few requests as possible.
+        Empty descriptions get None.
+        """
+        texts = [description[:EMBED_MAX_CHARS] for description in job_descriptions]
+        positions = [i for i, text in enumerate(texts) if text]
+
+        # Group descriptions into requests that stay under the per-request budget
+        batches: list[list[int]] = []
+        batch_chars = EMBED_BATCH_MAX_CHARS
+        for i in positions:
+            if batch_chars + len(texts[i]) > EMBED_BATCH_MAX_CHARS:
+                batches.append([])
+                batch_chars = 0
+            batches[-1].append(i)
+            batch_chars += len(texts[i])
+
+        responses = await asyncio.gather(*(
+            self.client.embeddings.create(
+                model=self.settings.matcher_embedding_model,
+                input=[texts[i] for i in batch],
+            )
+            for batch in batches
+        ))
+
+        vectors: list[Optional[list[float]]] = [None] * len(texts)
+        for batch, response in zip(batches, responses):
+            for i, item in zip(batch, response.data):
+                norm = math.hypot(*item.embedding)
+                vectors[i] = [v / norm for v in item.embedding] if norm else item.embedding
+        return vectors
+
+    def _record_usage(self, usage) -> None:
+        """Add a completion's prompt token counts to the running totals."""
+        if usage is None:
+            return
+        self.prompt_tokens += usage.prompt_tokens
+        details = usage.prompt_tokens_details
+        if details is not None and details.cached_tokens:
+            self.cached_prompt_tokens += details.cached_tokens
+
+    @staticmethod
+    def _parse_response(content: str) -> dict:
+        """Parse the JSON response, extracting score and reasoning by pattern if it is malformed."""
+        try:
+            return json_loads(content)
+        except json.JSONDecodeError:
+            score = _SCORE_RE.search(content)
+            if score is None:
+                raise
+            reasoning = _REASONING_RE.search(content)
+            return {
+                "score": score.group(1),
+                "reasoning": json_loads(reasoning.group(1)) if reasoning else "",
+            }
+
     async def match_job(
         self,
         job_title: str,
         company: str,
         location: str,
         job_description: str,
+        job_embedding: Optional[list[float]] = None,
     ) -> MatchResult:
         """
         Match a job against the CV using LLM.
+        job_embedding, when precomputed with embed_jobs, saves the semantic
+        cache its own embedding request.
 
         Returns:
             MatchResult with score (1-5) and reasoning
         """
-        cv_context = self.cv_loader.to_context_string()
+        cv_context = (
+            self.cv_loader.to_context_string()
+            if self.settings.matcher_verbose_context
+            else self.cv_loader.to_compact_context()
+        )
 
-        user_prompt = f"""## Candidate CV:
-{cv_context}
+        # Near-duplicate postings reuse an earlier score instead of a new completion
+        cache = self.semantic_cache if job_description else None
+        job_vector = job_embedding
+        if cache is not None:
+            try:
+                if job_vector is None:
+                    (job_vector,) = await self.embed_jobs([job_description])
+                cached = cache.lookup(
+                    self._hash_cv(cv_context),
+                    job_vector,
+                    self.settings.matcher_semantic_cache_threshold,
+                )
+            except Exception as e:
+                logger.warning(f"Semantic match cache lookup failed: {e}")
+                cached = None
+            if cached is not None:
+                score, reasoning, similarity = cached
+                logger.info(
+                    f"Matched {job_title} at {company}: score={score} "
+                    f"(cached, similarity={similarity:.3f})"
+                )
+                return MatchResult(score=score, reasoning=reasoning)
 
-## Job Posting:
+        # The CV gets its own message so the system prompt + CV prefix is byte-identical
+        # across jobs and served from OpenAI's prompt cache
+        cv_prompt = f"## Candidate CV:\n{cv_context}"
+        job_prompt = f"""## Job Posting:
 **Title:** {job_title}
 **Company:** {company}
 **Location:** {location}
@@ -101,23 +258,29 @@ class LLMMatcher:
 {job_description}
 
 ## Task:
-Evaluate how well this candidate matches the job requirements.
-Respond in the following JSON format only:
-
-{{"score": <1-5>, "reasoning": "<2-3 sentence explanation>"}}"""
+Evaluate how well this candidate matches the job requirements."""
 
         try:
+            if self.token_budget is not None:
+                # The rate limiter counts the completion cap along with the prompt
+                await self.token_budget.acquire(
+                    estimate_tokens(SYSTEM_PROMPT, cv_prompt, job_prompt) + MATCH_MAX_TOKENS
+                )
+
             response = await self.client.chat.completions.create(
                 model=self.settings.openai_model_mini,  # Use mini model for cost efficiency
                 messages=[
                     {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
+                    {"role": "user", "content": cv_prompt},
+                    {"role": "user", "content": job_prompt},
                 ],
                 temperature=0.3,  # Lower temperature for more consistent scoring
-                max_tokens=500,
-                response_format={"type": "json_object"},  # Force JSON response
+                max_tokens=MATCH_MAX_TOKENS,
+                response_format={"type": "json_schema", "json_schema": MATCH_SCHEMA},
             )
 
+            self._record_usage(response.usage)
+
             content = response.choices[0].message.content
             if not content:
                 return MatchResult(
@@ -128,7 +291,7 @@ Respond in the following JSON format only:
                 )
 
             # Parse JSON response
-            result = json.loads(content)
+            result = self._parse_response(content)
             score = int(result.get("score", 0))
             reasoning = result.get("reasoning", "")
 
@@ -137,6 +300,12 @@ Respond in the following JSON format only:
                 logger.warning(f"Invalid score {score}, clamping to range 1-5")
                 score = max(1, min(5, score))
 
+            if cache is not None and job_vector is not None:
+                try:
+                    cache.store(self._hash_cv(cv_context), job_vector, score, reasoning)
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to cache match result: {e}")
+
             logger.info(f"Matched {job_title} at {company}: score={score}")
             return MatchResult(score=score, reasoning=reasoning)
 
@@ -5,19 +5,26 @@ Matches qualified jobs against CV using LLM.
 
 import asyncio
 import sys
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from typing import Optional
 
 import click
+from asyncpg import Record
 from loguru import logger
 
+from shared import event_loop
 from shared.config import get_settings
 from shared.database import Database
+from shared.openai_client import close_openai_clients
 
 from .cv_loader import CVLoader
-from .llm_matcher import LLMMatcher
+from .dedup import NearDuplicateIndex
+from .llm_matcher import LLMMatcher, MatchResult
+
+# Match results are written in batches of this size rather than once per job
+DB_FLUSH_SIZE = 16
+
+# Qualified jobs' details are fetched in chunks of this size as matching proceeds
+FETCH_CHUNK_SIZE = 50
 
 
 def setup_logging():
@@ -49,6 +56,7 @@ async def match_jobs(
     limit: int = 50,
     min_score: int = 3,
     reprocess: bool = False,
+    max_concurrent: Optional[int] = None,
 ) -> tuple[int, int, int]:
     """
     Match qualified jobs against CV using LLM.
@@ -57,6 +65,7 @@ async def match_jobs(
         limit: Maximum jobs to process
         min_score: Minimum LLM score to consider a good match (for reporting)
         reprocess: Reprocess already matched jobs
+        max_concurrent: Maximum jobs matched at once (defaults to settings.matcher_concurrency)
 
     Returns:
         Tuple of (total_processed, good_matches, poor_matches)
@@ -75,67 +84,177 @@ async def match_jobs(
     matcher = LLMMatcher(cv_loader)
 
     try:
-        # Get qualified jobs that haven't been matched yet
-        async with db.pool.acquire() as conn:
-            if reprocess:
-                # Get all qualified jobs
-                rows = await conn.fetch(
-                    """
-                    SELECT * FROM jobs
-                    WHERE status = 'qualified'
-                    ORDER BY llm_match_score DESC NULLS LAST, created_at DESC
-                    LIMIT $1
-                    """,
-                    limit,
-                )
+        if reprocess:
+            # Get all qualified jobs
+            ids_query = """
+                SELECT id FROM jobs
+                WHERE status = 'qualified'
+                ORDER BY llm_match_score DESC NULLS LAST, created_at DESC
+                LIMIT $1
+            """
+        else:
+            # Get only unmatched qualified jobs
+            ids_query = """
+                SELECT id FROM jobs
+                WHERE status = 'qualified' AND matched_at IS NULL
+                ORDER BY created_at DESC
+                LIMIT $1
+            """
+        details_query = """
+            SELECT id, title, company, location, description FROM jobs
+            WHERE id = ANY($1::uuid[])
+        """
+
+        # Each match is dominated by LLM latency; bound how many run at once to respect rate limits
+        slots = asyncio.Semaphore(max_concurrent or settings.matcher_concurrency)
+        tasks: list[asyncio.Task] = []
+        results: asyncio.Queue[Optional[tuple[Record, MatchResult]]] = asyncio.Queue()
+        fetched = 0
+
+        # Near-duplicate postings reuse their representative's result instead of an LLM call
+        dedup = NearDuplicateIndex() if settings.matcher_dedup else None
+        matched: dict[str, MatchResult] = {}
+        duplicates: dict[str, list[Record]] = {}
+        # Representatives whose match failed; their later duplicates are matched on their own
+        failed: set[str] = set()
+
+        async def match_one(job: Record, embedding: Optional[list[float]]) -> None:
+            """
+            Run the LLM match for one job and queue its result. If it fails, a
+            near-duplicate waiting on it is matched in its place, in the same slot.
+            """
+            try:
+                while True:
+                    logger.debug(f"Matching: {job.get('title', '')} at {job.get('company', '')}")
+                    try:
+                        result = await matcher.match_job(
+                            job_title=job.get("title", ""),
+                            company=job.get("company", ""),
+                            location=job.get("location", ""),
+                            job_description=job.get("description", ""),
+                            job_embedding=embedding,
+                        )
+                    except Exception as e:
+                        result = MatchResult(score=0, reasoning="", success=False, error=str(e))
+
+                    job_id = str(job["id"])
+                    waiting = duplicates.pop(job_id, [])
+                    results.put_nowait((job, result))
+                    if result.success:
+                        matched[job_id] = result
+                        for duplicate in waiting:
+                            results.put_nowait((duplicate, result))
+                        return
+
+                    failed.add(job_id)
+                    if not waiting:
+                        return
+                    job, *rest = waiting
+                    if rest:
+                        duplicates[str(job["id"])] = rest
+                    embedding = None
+            finally:
+                slots.release()
+
+        def find_duplicate(job: Record) -> bool:
+            """Attach the job to an earlier near-duplicate posting. Returns True if one exists."""
+            if dedup is None or not job.get("description"):
+                return False
+            representative = dedup.find_or_add(
+                str(job["id"]), job.get("title") or "", job["description"]
+            )
+            if representative is None or representative in failed:
+                return False
+            logger.debug(f"Duplicate posting: {job.get('title', '')} at {job.get('company', '')}")
+            if representative in matched:
+                results.put_nowait((job, matched[representative]))
             else:
-                # Get only unmatched qualified jobs
-                rows = await conn.fetch(
-                    """
-                    SELECT * FROM jobs
-                    WHERE status = 'qualified' AND matched_at IS NULL
-                    ORDER BY created_at DESC
-                    LIMIT $1
-                    """,
-                    limit,
-                )
-
-        jobs = [dict(row) for row in rows]
-        logger.info(f"Processing {len(jobs)} qualified jobs")
+                duplicates.setdefault(representative, []).append(job)
+            return True
+
+        async def dispatch_jobs() -> None:
+            """Load jobs chunk by chunk and start a match for each as a slot frees up."""
+            nonlocal fetched
+            try:
+                # The order is fixed up front: reprocessing rewrites the scores it sorts by.
+                # Descriptions are then loaded per chunk, each on a briefly held connection,
+                # so no connection or transaction stays open across the LLM calls.
+                async with db.pool.acquire() as conn:
+                    job_ids = [row["id"] for row in await conn.fetch(ids_query, limit)]
+
+                for start in range(0, len(job_ids), FETCH_CHUNK_SIZE):
+                    chunk = job_ids[start:start + FETCH_CHUNK_SIZE]
+                    async with db.pool.acquire() as conn:
+                        by_id = {row["id"]: row for row in await conn.fetch(details_query, chunk)}
+                    rows = [by_id[job_id] for job_id in chunk if job_id in by_id]
+                    fetched += len(rows)
+                    # Records are read in place; fields are accessed by name like a dict
+                    jobs = [job for job in rows if not find_duplicate(job)]
+                    logger.debug(f"Fetched {len(rows)} qualified jobs")
+
+                    # Embed the chunk's descriptions for the semantic cache in batched requests;
+                    # jobs without a description skip the cache
+                    embeddings: list[Optional[list[float]]] = [None] * len(jobs)
+                    described = [i for i, job in enumerate(jobs) if job.get("description")]
+                    if described and matcher.semantic_cache is not None:
+                        try:
+                            vectors = await matcher.embed_jobs(
+                                [jobs[i]["description"] for i in described]
+                            )
+                            for i, vector in zip(described, vectors):
+                                embeddings[i] = vector
+                        except Exception as e:
+                            logger.warning(f"Batch embedding failed, embedding per job: {e}")
+
+                    for job, embedding in zip(jobs, embeddings):
+                        await slots.acquire()
+                        tasks.append(asyncio.create_task(match_one(job, embedding)))
+            finally:
+                # Matches already started still report, even if fetching failed
+                await asyncio.gather(*tasks, return_exceptions=True)
+                results.put_nowait(None)
 
         total_processed = 0
         good_matches = 0
         poor_matches = 0
-
-        for job in jobs:
-            job_id = str(job["id"])
-            title = job.get("title", "")
-            company = job.get("company", "")
-            location = job.get("location", "")
-            description = job.get("description", "")
-
-            logger.debug(f"Matching: {title} at {company}")
-
-            # Perform LLM matching
-            result = await matcher.match_job(
-                job_title=title,
-                company=company,
-                location=location,
-                job_description=description,
-            )
-
-            if result.success:
-                # Update job with match results
-                await db.update_job_match(
-                    job_id=job_id,
-                    llm_match_score=result.score,
-                    llm_match_reasoning=result.reasoning,
-                )
-
-                total_processed += 1
+        failed_matches = 0
+
+        # (job_id, score, reasoning) waiting to be written
+        pending: list[tuple[str, int, str]] = []
+
+        async def flush_matches() -> None:
+            """Write buffered match results in one statement and count them."""
+            nonlocal total_processed, good_matches, poor_matches
+            batch = pending[:]
+            pending.clear()
+            if not batch:
+                return
+            try:
+                await db.bulk_update_job_matches(batch)
+            except Exception as e:
+                logger.error(f"Failed to store {len(batch)} match results: {e}")
+                return
+            good = sum(score >= min_score for _, score, _ in batch)
+            total_processed += len(batch)
+            good_matches += good
+            poor_matches += len(batch) - good
+
+        # Handle each match as soon as it returns instead of waiting on the slowest one
+        dispatcher = asyncio.create_task(dispatch_jobs())
+        try:
+            while (item := await results.get()) is not None:
+                job, result = item
+                title = job.get("title", "")
+                company = job.get("company", "")
+
+                if not result.success:
+                    logger.error(f"Failed to match {title} at {company}: {result.error}")
+                    failed_matches += 1
+                    continue
+
+                pending.append((str(job["id"]), result.score, result.reasoning))
 
                 if result.score >= min_score:
-                    good_matches += 1
                     reasoning_preview = (
                         result.reasoning[:100] + "..."
                         if len(result.reasoning) > 100
@@ -146,22 +265,39 @@ async def match_jobs(
                         f"(score: {result.score}/5) - {reasoning_preview}"
                     )
                 else:
-                    poor_matches += 1
                     logger.debug(
                         f"Poor match: {title} at {company} (score: {result.score}/5)"
                     )
-            else:
-                logger.error(f"Failed to match {title} at {company}: {result.error}")
 
+                if len(pending) >= DB_FLUSH_SIZE:
+                    await flush_matches()
+
+            await flush_matches()
+            # Surface a failed fetch
+            await dispatcher
+        finally:
+            # Don't leave matches running if the loop is interrupted
+            dispatcher.cancel()
+            for task in tasks:
+                task.cancel()
+
+        logger.info(f"Processed {fetched} qualified jobs")
+        if matcher.prompt_tokens:
+            logger.info(
+                f"Prompt cache: {matcher.cached_prompt_tokens}/{matcher.prompt_tokens} "
+                f"prompt tokens cached ({matcher.cached_prompt_tokens / matcher.prompt_tokens:.0%})"
+            )
         logger.info(
             f"Matching complete: {total_processed} processed, "
-            f"{good_matches} good matches, {poor_matches} poor matches"
+            f"{good_matches} good matches, {poor_matches} poor matches, "
+            f"{failed_matches} failed"
         )
 
         return total_processed, good_matches, poor_matches
 
     finally:
         await db.disconnect()
+        await close_openai_clients()
 
 
 @click.command()
@@ -225,9 +361,9 @@ def main(
                 logger.info(f"Sleeping for {interval} seconds")
                 await asyncio.sleep(interval)
 
-        asyncio.run(run_daemon())
+        event_loop.run(run_daemon())
     else:
-        total, good, poor = asyncio.run(
+        total, good, poor = event_loop.run(
             match_jobs(
                 limit=limit,
                 min_score=min_score,
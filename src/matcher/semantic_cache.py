@@ -0,0 +1,108 @@
+"""
+Semantic cache for LLM match results.
+Reuses the score of an earlier job whose description embedding is close
+enough to the new one (reposts, cross-board duplicates), per CV version.
+"""
+
+import math
+import sqlite3
+import time
+from array import array
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS match_cache (
+    id INTEGER PRIMARY KEY,
+    cv_hash TEXT NOT NULL,
+    embedding BLOB NOT NULL,
+    score INTEGER NOT NULL,
+    reasoning TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS match_cache_cv_hash ON match_cache (cv_hash);
+"""
+
+
+class SemanticMatchCache:
+    """
+    sqlite-backed store of (CV hash, unit-length job embedding) -> match result.
+    Vectors for a CV hash are read once and then searched in memory.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 10_000):
+        self.path = path
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        # cv_hash -> [(row id, vector)]
+        self._vectors: dict[str, list[tuple[int, array]]] = {}
+
+    def _entries(self, cv_hash: str) -> list[tuple[int, array]]:
+        """Get the cached vectors for a CV hash, loading them on first use."""
+        entries = self._vectors.get(cv_hash)
+        if entries is None:
+            rows = self.conn.execute(
+                "SELECT id, embedding FROM match_cache WHERE cv_hash = ?", (cv_hash,)
+            )
+            entries = self._vectors[cv_hash] = [
+                (row_id, array("f", blob)) for row_id, blob in rows
+            ]
+        return entries
+
+    def lookup(
+        self, cv_hash: str, vector: list[float], threshold: float
+    ) -> Optional[tuple[int, str, float]]:
+        """Return (score, reasoning, similarity) of the closest entry at or above threshold."""
+        best_id, best_similarity = None, threshold
+        for row_id, cached in self._entries(cv_hash):
+            similarity = math.sumprod(vector, cached)
+            if similarity >= best_similarity:
+                best_id, best_similarity = row_id, similarity
+        if best_id is None:
+            return None
+
+        with self.conn:
+            self.conn.execute(
+                "UPDATE match_cache SET last_used = ? WHERE id = ?", (time.time(), best_id)
+            )
+        score, reasoning = self.conn.execute(
+            "SELECT score, reasoning FROM match_cache WHERE id = ?", (best_id,)
+        ).fetchone()
+        return score, reasoning, best_similarity
+
+    def store(self, cv_hash: str, vector: list[float], score: int, reasoning: str) -> None:
+        """Add a match result, evicting the least recently used entries beyond max_entries."""
+        packed = array("f", vector)
+        now = time.time()
+        with self.conn:
+            row_id = self.conn.execute(
+                """
+                INSERT INTO match_cache (cv_hash, embedding, score, reasoning, created_at, last_used)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (cv_hash, packed.tobytes(), score, reasoning, now, now),
+            ).lastrowid
+            evicted = self.conn.execute(
+                """
+                DELETE FROM match_cache WHERE id IN (
+                    SELECT id FROM match_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            ).rowcount
+        entries = self._vectors.get(cv_hash)
+        if entries is not None:
+            entries.append((row_id, packed))
+
+        if evicted:
+            # Evicted rows may belong to any CV hash; reload vectors lazily
+            logger.debug(f"Evicted {evicted} match cache entries")
+            self._vectors.clear()
+
+    def close(self) -> None:
+        """Close the sqlite connection."""
+        self.conn.close()
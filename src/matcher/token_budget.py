@@ -0,0 +1,45 @@
+"""
+Token-per-minute budget for LLM requests.
+Paces concurrent requests so their estimated tokens stay within the
+account's rate limit instead of bouncing off 429s.
+"""
+
+import asyncio
+import time
+from collections import deque
+
+# Rough characters-per-token ratio for estimating prompt size
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Estimate the token count of texts from their length."""
+    return sum(map(len, texts)) // CHARS_PER_TOKEN
+
+
+class TokenBudget:
+    """Rolling one-minute token budget shared by concurrent requests."""
+
+    def __init__(self, tokens_per_minute: int, window: float = 60.0):
+        self.tokens_per_minute = tokens_per_minute
+        self.window = window
+        # (monotonic time, tokens) of requests inside the window
+        self._spent: deque[tuple[float, int]] = deque()
+        self._total = 0
+        # Waiters are served in order so large requests are not starved
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until tokens fit in the last minute's budget, then spend them."""
+        # A request larger than the whole budget runs once the window is empty
+        tokens = min(tokens, self.tokens_per_minute)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._spent and self._spent[0][0] <= now - self.window:
+                    self._total -= self._spent.popleft()[1]
+                if self._total + tokens <= self.tokens_per_minute:
+                    break
+                await asyncio.sleep(self._spent[0][0] + self.window - now)
+            self._spent.append((now, tokens))
+            self._total += tokens
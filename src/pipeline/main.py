@@ -15,16 +15,12 @@ Usage:
     python -m pipeline.main --dry-run
 """
 
-import asyncio
 import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import click
 from loguru import logger
 
+from shared import event_loop
 from shared.config import get_settings
 from pipeline.unified import UnifiedPipeline
 
@@ -209,7 +205,7 @@ def main(
         finally:
             await pipeline.cleanup()
 
-    asyncio.run(run())
+    event_loop.run(run())
 
 
 if __name__ == "__main__":
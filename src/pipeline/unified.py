@@ -6,9 +6,11 @@ to minimize time-to-application for high-match jobs.
 """
 
 import asyncio
+import itertools
 import os
 import sys
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -20,9 +22,6 @@ if sys.platform == "darwin":
     if os.path.exists(homebrew_lib):
         os.environ["DYLD_LIBRARY_PATH"] = homebrew_lib
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from loguru import logger
 
 from scraper.apify_client import ApifyClient
@@ -34,6 +33,7 @@ from generator.rendercv_generator import RenderCVGenerator
 from generator.email_service import EmailService
 from shared.config import Settings, get_settings
 from shared.database import Database
+from shared.openai_client import close_openai_clients
 
 
 @dataclass
@@ -94,6 +94,7 @@ class UnifiedPipeline:
         self._matcher: Optional[LLMMatcher] = None
         self._pdf_generator: Optional[RenderCVGenerator] = None
         self._email_service: Optional[EmailService] = None
+        self._match_sem: Optional[asyncio.Semaphore] = None
 
         # CV directory
         self.cv_dir = Path(__file__).parent.parent / "generator" / "cv"
@@ -113,6 +114,8 @@ class UnifiedPipeline:
         ciso_cv_path = self.cv_dir / "ernest_haberli_ciso.yaml"
         self._cv_loader = CVLoader(ciso_cv_path)
         self._matcher = LLMMatcher(self._cv_loader, settings=self.settings)
+        # Jobs are matched concurrently; bound how many run at once to respect rate limits
+        self._match_sem = asyncio.Semaphore(self.settings.matcher_concurrency)
 
         # Generator
         self._pdf_generator = RenderCVGenerator(
@@ -120,7 +123,8 @@ class UnifiedPipeline:
         )
 
         # Email service
-        if not self.skip_email:
+        # Dry runs never send email, so don't set up the client
+        if not (self.skip_email or self.dry_run):
             self._email_service = EmailService(settings=self.settings)
 
         logger.info("Pipeline initialized successfully")
@@ -131,6 +135,7 @@ class UnifiedPipeline:
             await self._db.disconnect()
         if self._scraper:
             await self._scraper.close()
+        await close_openai_clients()
 
     async def process_single_job(
         self,
@@ -143,6 +148,64 @@ class UnifiedPipeline:
         Returns:
             LLM match score if processed, None if skipped/error
         """
+        application = await self._match_only(job_data, stats)
+        if application is None:
+            return None
+
+        if application["score"] >= self.min_score:
+            await self._generate_and_send_safe(application, stats)
+        return application["score"]
+
+    def _is_stale(self, job_data: dict) -> bool:
+        """Check whether a job was posted longer ago than max_hours_old / max_days_old."""
+        posted_at = job_data.get("posted_at")
+        if not posted_at or (self.max_days_old <= 0 and self.max_hours_old <= 0):
+            return False
+
+        if isinstance(posted_at, str):
+            from dateutil import parser
+            try:
+                posted_at = parser.parse(posted_at)
+            except Exception:
+                return False
+
+        # Make sure posted_at is timezone-aware
+        if posted_at.tzinfo is None:
+            posted_at = posted_at.replace(tzinfo=timezone.utc)
+
+        now = datetime.now(timezone.utc)
+        title = job_data.get("title", "Unknown")
+        company = job_data.get("company", "Unknown")
+
+        # Check hours filter first (more restrictive)
+        if self.max_hours_old > 0:
+            cutoff_time = now - timedelta(hours=self.max_hours_old)
+            if posted_at < cutoff_time:
+                hours_old = (now - posted_at).total_seconds() / 3600
+                logger.debug(f"Skipping old job ({hours_old:.1f} hours old): {title} at {company}")
+                return True
+        # Fall back to days filter
+        elif self.max_days_old > 0:
+            cutoff_date = now - timedelta(days=self.max_days_old)
+            if posted_at < cutoff_date:
+                days_old = (now - posted_at).days
+                logger.debug(f"Skipping old job ({days_old} days old): {title} at {company}")
+                return True
+        return False
+
+    async def _match_only(
+        self,
+        job_data: dict,
+        stats: PipelineStats,
+    ) -> Optional[dict]:
+        """
+        Store and score a new job, without generating an application.
+        Jobs that already carry an "id" were checked and stored in bulk by _scrape_titles.
+
+        Returns:
+            _generate_and_send keyword arguments (minus stats) if matched,
+            None if skipped/error
+        """
         # Use linkedin_id as the unique identifier
         linkedin_id = job_data.get("linkedin_id")
         title = job_data.get("title", "Unknown")
@@ -152,55 +215,29 @@ class UnifiedPipeline:
         apply_url = job_data.get("apply_url") or job_data.get("url", "")
 
         try:
-            # Step 1: Check if job already exists
-            existing = await self._db.get_job_by_linkedin_id(linkedin_id)
-            if existing:
-                logger.debug(f"Skipping existing job: {title} at {company}")
-                return None
-
-            # Step 1.5: Check job freshness
-            posted_at = job_data.get("posted_at")
-            if posted_at and (self.max_days_old > 0 or self.max_hours_old > 0):
-                if isinstance(posted_at, str):
-                    from dateutil import parser
-                    try:
-                        posted_at = parser.parse(posted_at)
-                    except Exception:
-                        posted_at = None
-
-                if posted_at:
-                    # Make sure posted_at is timezone-aware
-                    if posted_at.tzinfo is None:
-                        posted_at = posted_at.replace(tzinfo=timezone.utc)
-
-                    now = datetime.now(timezone.utc)
-
-                    # Check hours filter first (more restrictive)
-                    if self.max_hours_old > 0:
-                        cutoff_time = now - timedelta(hours=self.max_hours_old)
-                        if posted_at < cutoff_time:
-                            hours_old = (now - posted_at).total_seconds() / 3600
-                            logger.debug(f"Skipping old job ({hours_old:.1f} hours old): {title} at {company}")
-                            return None
-                    # Fall back to days filter
-                    elif self.max_days_old > 0:
-                        cutoff_date = now - timedelta(days=self.max_days_old)
-                        if posted_at < cutoff_date:
-                            days_old = (now - posted_at).days
-                            logger.debug(f"Skipping old job ({days_old} days old): {title} at {company}")
-                            return None
+            internal_job_id = job_data.get("id")
+            if internal_job_id is None:
+                # Step 1: Check if job already exists
+                existing = await self._db.get_job_by_linkedin_id(linkedin_id)
+                if existing:
+                    logger.debug(f"Skipping existing job: {title} at {company}")
+                    return None
+
+                # Step 1.5: Check job freshness
+                if self._is_stale(job_data):
+                    return None
+
+                # Step 2: Insert job into database (use the full job_data dict)
+                job_data["status"] = "scraped"
+
+                if not self.dry_run:
+                    inserted_job = await self._db.insert_job(job_data)
+                    internal_job_id = str(inserted_job["id"])
+                else:
+                    internal_job_id = linkedin_id
 
             stats.jobs_new += 1
 
-            # Step 2: Insert job into database (use the full job_data dict)
-            job_data["status"] = "scraped"
-
-            if not self.dry_run:
-                inserted_job = await self._db.insert_job(job_data)
-                internal_job_id = str(inserted_job["id"])
-            else:
-                internal_job_id = linkedin_id
-
             # Step 3: Match with LLM
             logger.info(f"Matching: {title} at {company}")
             match_result = await self._matcher.match_job(
@@ -236,27 +273,60 @@ class UnifiedPipeline:
 
             logger.info(f"Match score: {score}/5 - {title} at {company}")
 
-            # Step 4: If high match, generate CV and send email
-            if score >= self.min_score:
-                await self._generate_and_send(
-                    job_id=internal_job_id,
-                    title=title,
-                    company=company,
-                    location=location,
-                    description=description,
-                    apply_url=apply_url,
-                    score=score,
-                    reasoning=reasoning,
-                    stats=stats,
-                )
-
-            return score
+            return {
+                "job_id": internal_job_id,
+                "title": title,
+                "company": company,
+                "location": location,
+                "description": description,
+                "apply_url": apply_url,
+                "score": score,
+                "reasoning": reasoning,
+            }
 
         except Exception as e:
             logger.error(f"Error processing {title} at {company}: {e}")
             stats.errors += 1
             return None
 
+    async def _match_into_queue(
+        self,
+        job_data: dict,
+        stats: PipelineStats,
+        applications: asyncio.PriorityQueue,
+        order: Iterator[int],
+    ) -> None:
+        """Match a job once a slot is free, queueing it for generation if it qualifies."""
+        async with self._match_sem:
+            application = await self._match_only(job_data, stats)
+        if application is not None and application["score"] >= self.min_score:
+            # Highest score first; the counter keeps equal scores in match order
+            applications.put_nowait((-application["score"], next(order), application))
+
+    async def _application_worker(
+        self,
+        applications: asyncio.PriorityQueue,
+        stats: PipelineStats,
+    ) -> None:
+        """Generate and send applications from the queue, best match first."""
+        while True:
+            _, _, application = await applications.get()
+            try:
+                await self._generate_and_send_safe(application, stats)
+            finally:
+                applications.task_done()
+
+    async def _generate_and_send_safe(self, application: dict, stats: PipelineStats) -> None:
+        """Generate and send an application, recording failures in stats."""
+        try:
+            await self._generate_and_send(**application, stats=stats)
+        except Exception as e:
+            logger.error(
+                f"Error generating application for {application['title']} "
+                f"at {application['company']}: {e}"
+            )
+            stats.errors += 1
+
     async def _generate_and_send(
         self,
         job_id: str,
@@ -291,11 +361,15 @@ class UnifiedPipeline:
             stats.errors += 1
             return
 
-        # Generate PDF
-        pdf_result = self._pdf_generator.generate_pdf(
+        # Generate CV and cover letter PDFs concurrently, off the event loop
+        cv_name = tailoring_result.tailored_cv.get("cv", {}).get("name", "Candidate")
+        pdf_result, cover_letter_pdf = await self._pdf_generator.generate_application_pdfs(
             cv_data=tailoring_result.tailored_cv,
+            cover_letter=tailoring_result.cover_letter,
             job_id=job_id,
             company=company,
+            job_title=title,
+            candidate_name=cv_name,
         )
 
         if not pdf_result.success:
@@ -303,18 +377,8 @@ class UnifiedPipeline:
             stats.errors += 1
             return
 
-        # Generate cover letter PDF
-        cv_name = tailoring_result.tailored_cv.get("cv", {}).get("name", "Candidate")
-        cover_letter_pdf = self._pdf_generator.generate_cover_letter_pdf(
-            cover_letter=tailoring_result.cover_letter,
-            job_id=job_id,
-            company=company,
-            job_title=title,
-            candidate_name=cv_name,
-        )
-
         # Send email
-        if self._email_service and not self.dry_run:
+        if self._email_service:
             job_dict = {
                 "id": job_id,
                 "title": title,
@@ -325,7 +389,9 @@ class UnifiedPipeline:
                 "llm_match_reasoning": reasoning,
             }
 
-            email_result = self._email_service.send_application_package(
+            # Resend's client blocks; keep it off the loop shared with scraping and matching
+            email_result = await asyncio.to_thread(
+                self._email_service.send_application_package,
                 job=job_dict,
                 cv_pdf_path=pdf_result.pdf_path,
                 cover_letter=tailoring_result.cover_letter,
@@ -356,6 +422,79 @@ class UnifiedPipeline:
             await self._db.insert_application(application)
             await self._db.update_job_generated(job_id, status="generated")
 
+    async def _scrape_titles(
+        self,
+        job_titles: list[str],
+        location: str,
+        max_jobs_per_title: int,
+        scraped: asyncio.Queue,
+        stats: PipelineStats,
+    ) -> None:
+        """
+        Scrape each title in turn, queueing its new jobs; queues None when done.
+        Each title's jobs are checked against and stored in the database in bulk.
+        """
+        try:
+            for title in job_titles:
+                logger.info(f"Scraping: {title} in {location}")
+
+                try:
+                    jobs = await self._scraper.run_actor_sync(
+                        title=title,
+                        location=location,
+                        max_jobs=max_jobs_per_title,
+                        timeout_secs=300,
+                        date_posted=self.date_posted,
+                    )
+
+                    stats.jobs_scraped += len(jobs)
+                    logger.info(f"Found {len(jobs)} jobs for '{title}'")
+
+                    # Convert to dict format using the model's to_db_dict method,
+                    # keeping one copy of any posting listed twice
+                    job_dicts = {
+                        job_dict["linkedin_id"]: job_dict
+                        for job_dict in (job.to_db_dict() for job in jobs)
+                    }
+                    existing = await self._db.get_existing_linkedin_ids(list(job_dicts))
+                    new_jobs = [
+                        job_dict
+                        for linkedin_id, job_dict in job_dicts.items()
+                        if linkedin_id not in existing and not self._is_stale(job_dict)
+                    ]
+                    logger.debug(
+                        f"Skipping {len(existing)} existing and "
+                        f"{len(job_dicts) - len(existing) - len(new_jobs)} old jobs for '{title}'"
+                    )
+
+                    if not self.dry_run:
+                        # Only jobs actually inserted are matched; others were stored meanwhile
+                        job_ids = await self._db.bulk_insert_jobs(new_jobs)
+                    else:
+                        job_ids = {
+                            job_dict["linkedin_id"]: job_dict["linkedin_id"] for job_dict in new_jobs
+                        }
+
+                    for job_dict in new_jobs:
+                        job_id = job_ids.get(job_dict["linkedin_id"])
+                        if job_id is None:
+                            logger.debug(f"Skipping job stored concurrently: {job_dict['title']}")
+                            continue
+                        job_dict["id"] = job_id
+                        job_dict["search_title"] = title  # Track which search found it
+                        scraped.put_nowait(job_dict)
+
+                    # Small delay between searches
+                    await asyncio.sleep(1)
+
+                except Exception as e:
+                    logger.error(f"Scraping failed for '{title}': {e}")
+                    stats.errors += 1
+
+            logger.info(f"Total jobs scraped: {stats.jobs_scraped}")
+        finally:
+            scraped.put_nowait(None)
+
     async def run_once(
         self,
         job_titles: Optional[list[str]] = None,
@@ -383,52 +522,41 @@ class UnifiedPipeline:
 
         logger.info(f"Starting pipeline run: {len(job_titles)} titles, location={location}")
 
-        # Collect all jobs first (for priority sorting)
-        all_jobs = []
-
-        for title in job_titles:
-            logger.info(f"Scraping: {title} in {location}")
-
-            try:
-                jobs = await self._scraper.run_actor_sync(
-                    title=title,
-                    location=location,
-                    max_jobs=max_jobs_per_title,
-                    timeout_secs=300,
-                    date_posted=self.date_posted,
-                )
-
-                stats.jobs_scraped += len(jobs)
-                logger.info(f"Found {len(jobs)} jobs for '{title}'")
-
-                # Convert to dict format using the model's to_db_dict method
-                for job in jobs:
-                    job_dict = job.to_db_dict()
-                    job_dict["search_title"] = title  # Track which search found it
-                    all_jobs.append(job_dict)
-
-                # Small delay between searches
-                await asyncio.sleep(1)
-
-            except Exception as e:
-                logger.error(f"Scraping failed for '{title}': {e}")
-                stats.errors += 1
-
-        logger.info(f"Total jobs scraped: {stats.jobs_scraped}")
-
-        # Process jobs - we'll collect scores and process high ones first
-        jobs_with_scores = []
+        # Matching starts as soon as each title's scrape returns, while later titles are scraped;
+        # jobs are matched concurrently up to matcher_concurrency
+        scraped: asyncio.Queue[Optional[dict]] = asyncio.Queue()
+        scrape_task = asyncio.create_task(
+            self._scrape_titles(job_titles, location, max_jobs_per_title, scraped, stats)
+        )
 
-        # First pass: match all jobs to get scores
-        for job_data in all_jobs:
-            score = await self.process_single_job(job_data, stats)
-            if score is not None:
-                jobs_with_scores.append((score, job_data))
+        # Qualifying matches wait here for generation + email, score 5 ahead of score 4
+        applications: asyncio.PriorityQueue[tuple[int, int, dict]] = asyncio.PriorityQueue()
+        order = itertools.count()
+        workers = [
+            asyncio.create_task(self._application_worker(applications, stats))
+            for _ in range(self.settings.generator_concurrency)
+        ]
 
-        # Note: In this implementation, high-match jobs are already processed
-        # in process_single_job. The priority is handled by processing score 5
-        # jobs immediately when found. For even faster processing of score 5 jobs,
-        # we could parallelize the scraping and matching.
+        tasks: list[asyncio.Task] = []
+        seen: set[str] = set()
+        try:
+            while (job_data := await scraped.get()) is not None:
+                # Searches overlap; a posting found twice must not race itself into the database
+                linkedin_id = job_data.get("linkedin_id")
+                if linkedin_id in seen:
+                    continue
+                seen.add(linkedin_id)
+                tasks.append(asyncio.create_task(
+                    self._match_into_queue(job_data, stats, applications, order)
+                ))
+
+            # _match_only records its own failures in stats
+            await asyncio.gather(*tasks)
+            await applications.join()
+        finally:
+            scrape_task.cancel()
+            for task in tasks + workers:
+                task.cancel()
 
         logger.info(f"Pipeline run complete: {stats}")
         return stats
@@ -4,8 +4,12 @@ Scores jobs using template matching and translates if needed.
 """
 
 import asyncio
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -15,9 +19,33 @@ from loguru import logger
 
 from shared.config import get_settings
 from shared.database import Database
-from ranker.templates import TemplateMatcher
+from ranker.templates import ScoringResult, TemplateMatcher
 from ranker.translator import JobTranslator
 
+# Each worker process loads the templates once, in _init_score_worker
+_worker_matcher: Optional[TemplateMatcher] = None
+
+
+def _init_score_worker(templates_path: Path) -> None:
+    """Load the scoring templates in a worker process."""
+    global _worker_matcher
+    _worker_matcher = TemplateMatcher(templates_path)
+
+
+def _score_in_worker(title: str, description: str) -> ScoringResult:
+    """Score one job in a worker process."""
+    return _worker_matcher.score_job(title, description)
+
+
+@lru_cache(maxsize=1)
+def _score_pool(templates_path: Path) -> ProcessPoolExecutor:
+    """Worker processes for template scoring, started on first use and kept warm."""
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_score_worker,
+        initargs=(templates_path,),
+    )
+
 
 def setup_logging():
     """Configure loguru logging."""
@@ -79,13 +107,10 @@ async def rank_jobs(
         qualified_count = 0
         disqualified_count = 0
 
+        # Translate first, so the CPU-bound scoring can run as one batch
+        descriptions: list[str] = []
         for job in jobs:
-            job_id = str(job["_id"])
-            title = job.get("title", "")
             description = job.get("description", "")
-            company = job.get("company", "")
-
-            logger.debug(f"Ranking: {title} at {company}")
 
             # Translate if needed
             if translator and description:
@@ -98,9 +123,28 @@ async def rank_jobs(
                         {"_id": job["_id"]},
                         {"$set": {"description_translated": description}},
                     )
+            descriptions.append(description)
+
+        # Score the jobs
+        if settings.ranker_process_pool:
+            loop = asyncio.get_running_loop()
+            pool = _score_pool(settings.templates_path)
+            results = await asyncio.gather(*(
+                loop.run_in_executor(pool, _score_in_worker, job.get("title", ""), description)
+                for job, description in zip(jobs, descriptions)
+            ))
+        else:
+            results = [
+                matcher.score_job(job.get("title", ""), description)
+                for job, description in zip(jobs, descriptions)
+            ]
 
-            # Score the job
-            result = matcher.score_job(title, description)
+        for job, result in zip(jobs, results):
+            job_id = str(job["_id"])
+            title = job.get("title", "")
+            company = job.get("company", "")
+
+            logger.debug(f"Ranking: {title} at {company}")
 
             # Update job with ranking results
             status = "qualified" if result.passed else "disqualified"
@@ -11,6 +11,77 @@ from typing import Optional
 import yaml
 from loguru import logger
 
+try:
+    import ahocorasick
+except ImportError:  # optional; keyword lists fall back to a fused regex
+    ahocorasick = None
+
+
+def _is_word(char: str) -> bool:
+    """Match re's Unicode \\w for a single character."""
+    return char.isalnum() or char == "_"
+
+
+def _at_boundary(text: str, index: int) -> bool:
+    """Check for a \\b word boundary before text[index]."""
+    before = index > 0 and _is_word(text[index - 1])
+    after = index < len(text) and _is_word(text[index])
+    return before != after
+
+
+class KeywordSet:
+    """
+    Keywords matched on word boundaries, all found in one scan of the text.
+    Uses a pyahocorasick automaton when installed, otherwise a fused regex.
+    """
+
+    def __init__(self, keywords: list[str]):
+        self.keywords = [(keyword, keyword.lower().strip()) for keyword in keywords]
+        distinct = sorted(
+            {lowered for _, lowered in self.keywords if lowered}, key=len, reverse=True
+        )
+        self._regex: Optional[re.Pattern] = None
+        self._prefixes: list[tuple[str, re.Pattern]] = []
+        self._automaton = None
+        if not distinct:
+            return
+
+        if ahocorasick is not None:
+            # The automaton reports every occurrence of every keyword, nested ones included
+            self._automaton = ahocorasick.Automaton()
+            for lowered in distinct:
+                self._automaton.add_word(lowered, lowered)
+            self._automaton.make_automaton()
+            return
+
+        # Longest first, so each position reports the longest keyword found there;
+        # the zero-width lookahead tries every position, so keywords inside longer ones are found too
+        self._regex = re.compile(r'(?=\b(' + '|'.join(map(re.escape, distinct)) + r')\b)')
+        # A keyword that is a prefix of a longer one can be hidden by it at the same position
+        self._prefixes = [
+            (lowered, re.compile(r'\b' + re.escape(lowered) + r'\b'))
+            for lowered in distinct
+            if any(other != lowered and other.startswith(lowered) for other in distinct)
+        ]
+
+    def find(self, text_lower: str) -> list[str]:
+        """Return the keywords found in lowercased text, in keyword order."""
+        if self._automaton is not None:
+            found = {
+                lowered
+                for end, lowered in self._automaton.iter(text_lower)
+                if _at_boundary(text_lower, end + 1)
+                and _at_boundary(text_lower, end + 1 - len(lowered))
+            }
+        elif self._regex is not None:
+            found = {match.group(1) for match in self._regex.finditer(text_lower)}
+            for lowered, pattern in self._prefixes:
+                if lowered not in found and pattern.search(text_lower):
+                    found.add(lowered)
+        else:
+            return []
+        return [keyword for keyword, lowered in self.keywords if lowered in found]
+
 
 @dataclass
 class ScoringTemplate:
@@ -23,6 +94,15 @@ class ScoringTemplate:
     trigger_weight: int = 10
     support_weight: int = 4
     negative_weight: int = -15
+    # Compiled keyword matchers, built once per template
+    trigger_set: KeywordSet = field(init=False, repr=False)
+    support_set: KeywordSet = field(init=False, repr=False)
+    negative_set: KeywordSet = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.trigger_set = KeywordSet(self.trigger_keywords)
+        self.support_set = KeywordSet(self.support_keywords)
+        self.negative_set = KeywordSet(self.negative_keywords)
 
 
 @dataclass
@@ -95,30 +175,26 @@ class TemplateMatcher:
         return text.lower().strip()
 
     def _find_matches(
-        self, text: str, keywords: list[str], is_title: bool = False
+        self,
+        text_lower: str,
+        keywords: KeywordSet,
+        is_title: bool = False,
     ) -> tuple[list[str], int]:
         """
         Find keyword matches in text.
 
+        Args:
+            text_lower: Text already passed through _normalize_text
+            keywords: Compiled keywords from a ScoringTemplate
+
         Returns:
             Tuple of (matched keywords, total weighted score)
         """
-        text_lower = self._normalize_text(text)
-        matched = []
-        score = 0
-
-        for keyword in keywords:
-            keyword_lower = self._normalize_text(keyword)
-
-            # Use word boundary matching for more accurate results
-            pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-            if re.search(pattern, text_lower):
-                matched.append(keyword)
-                # Title matches get bonus
-                weight = 1.5 if is_title else 1.0
-                score += weight
+        matched = keywords.find(text_lower)
 
-        return matched, score
+        # Title matches get bonus
+        weight = 1.5 if is_title else 1.0
+        return matched, len(matched) * weight
 
     def score_job(
         self,
@@ -137,7 +213,10 @@ class TemplateMatcher:
         Returns:
             ScoringResult with score and matches
         """
-        combined_text = f"{title}\n{description}"
+        # Normalize once per job rather than per template and keyword list
+        title_lower = self._normalize_text(title)
+        description_lower = self._normalize_text(description)
+        combined_lower = f"{title_lower}\n{description_lower}"
         best_result: Optional[ScoringResult] = None
 
         templates_to_check = self.templates
@@ -147,10 +226,10 @@ class TemplateMatcher:
         for template in templates_to_check:
             # Match triggers
             title_triggers, title_trigger_score = self._find_matches(
-                title, template.trigger_keywords, is_title=True
+                title_lower, template.trigger_set, is_title=True
             )
             desc_triggers, desc_trigger_score = self._find_matches(
-                description, template.trigger_keywords, is_title=False
+                description_lower, template.trigger_set, is_title=False
             )
             all_triggers = list(set(title_triggers + desc_triggers))
             trigger_score = (len(all_triggers)) * template.trigger_weight
@@ -160,17 +239,17 @@ class TemplateMatcher:
 
             # Match support keywords
             title_support, _ = self._find_matches(
-                title, template.support_keywords, is_title=True
+                title_lower, template.support_set, is_title=True
             )
             desc_support, _ = self._find_matches(
-                description, template.support_keywords, is_title=False
+                description_lower, template.support_set, is_title=False
             )
             all_support = list(set(title_support + desc_support))
             support_score = len(all_support) * template.support_weight
 
             # Match negative keywords
             all_negative, _ = self._find_matches(
-                combined_text, template.negative_keywords
+                combined_lower, template.negative_set
             )
             negative_score = len(all_negative) * template.negative_weight
 
@@ -135,7 +135,7 @@ class ApifyClient:
         # Start actor run
         run_url = f"{self.base_url}/acts/{self.actor_id}/runs"
         logger.info(f"Starting Apify actor: {self.actor_id}")
-        logger.debug(f"Actor input: {actor_input}")
+        logger.debug("Actor input: {}", actor_input)
 
         response = await client.post(
             run_url,
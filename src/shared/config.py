@@ -67,6 +67,29 @@ class Settings(BaseSettings):
         description="Path to RenderCV base template"
     )
     generator_batch_size: int = Field(default=10, description="Jobs to process per batch")
+    generator_concurrency: int = Field(
+        default=8, description="Maximum jobs tailored concurrently in a batch"
+    )
+    generator_resume_max_tokens: int = Field(
+        default=1800, description="Completion token cap for LLM-written resumes"
+    )
+    generator_resume_sections: bool = Field(
+        default=False,
+        description="Write LLM resumes section by section with concurrent requests",
+    )
+    generator_cover_letter_max_tokens: int = Field(
+        default=900, description="Completion token cap for LLM-written cover letters"
+    )
+    generator_process_pool: bool = Field(
+        default=False, description="Reorder CVs in worker processes (for large concurrent batches)"
+    )
+    generator_semantic_matching: bool = Field(
+        default=False, description="Also match ATS keywords to CV text by embedding similarity"
+    )
+    generator_embedding_model: str = Field(default="text-embedding-3-small")
+    generator_semantic_threshold: float = Field(
+        default=0.35, description="Minimum cosine similarity for a semantic keyword match"
+    )
 
     # Email settings (Resend)
     resend_api_key: SecretStr = Field(default=SecretStr(""))
@@ -85,10 +108,37 @@ class Settings(BaseSettings):
         default=3, description="Minimum LLM score to consider good match"
     )
     matcher_batch_size: int = Field(default=50, description="Jobs to process per batch")
+    matcher_concurrency: int = Field(
+        default=20, description="Maximum jobs matched concurrently against the LLM"
+    )
+    matcher_tokens_per_minute: int = Field(
+        default=0, description="Token budget per minute for match requests (0 = unlimited)"
+    )
+    matcher_dedup: bool = Field(
+        default=True, description="Match near-duplicate postings (same title, SimHash) once per run"
+    )
+    matcher_verbose_context: bool = Field(
+        default=False, description="Send the full Markdown CV instead of the compact context"
+    )
+    matcher_semantic_cache: bool = Field(
+        default=False, description="Reuse match results of near-duplicate job descriptions"
+    )
+    matcher_embedding_model: str = Field(default="text-embedding-3-small")
+    matcher_semantic_cache_threshold: float = Field(
+        default=0.92, description="Minimum cosine similarity to reuse a cached match"
+    )
+    matcher_semantic_cache_size: int = Field(
+        default=10_000, description="Match results kept before least recently used are evicted"
+    )
     matcher_interval_seconds: int = Field(
         default=300, description="Polling interval in daemon mode"
     )
 
+    # Ranker settings
+    ranker_process_pool: bool = Field(
+        default=False, description="Score jobs against templates in worker processes"
+    )
+
     # Paths
     profile_path: Path = Field(default=Path("config/profile.yaml"))
     templates_path: Path = Field(default=Path("config/templates.yaml"))
@@ -83,6 +83,63 @@ class Database:
 
         return {"id": job_id, **job}
 
+    async def bulk_insert_jobs(self, jobs: list[dict[str, Any]]) -> dict[str, str]:
+        """
+        Insert many new jobs in one statement, skipping LinkedIn IDs that are already stored.
+        Returns {linkedin_id: id} for the jobs actually inserted.
+        """
+        if not jobs:
+            return {}
+
+        columns = list(zip(*(
+            (
+                uuid.uuid4(),
+                job.get("linkedin_id") or job.get("linkedin_job_id"),
+                job.get("url"),
+                job.get("title"),
+                job.get("company"),
+                job.get("company_url"),
+                job.get("location"),
+                job.get("description"),
+                job.get("posted_at"),
+                job.get("posted_time"),
+                job.get("applications_count"),
+                job.get("apply_url"),
+                job.get("status", "scraped"),
+            )
+            for job in jobs
+        )))
+
+        async with self.pool.acquire() as conn:
+            # A posting stored concurrently since the existence check is skipped, not fatal
+            rows = await conn.fetch(
+                """
+                INSERT INTO jobs (
+                    id, linkedin_id, url, title, company, company_url, location,
+                    description, posted_at, posted_time, applications_count,
+                    apply_url, status
+                )
+                SELECT
+                    id, linkedin_id, url, title, company, company_url, location,
+                    description, posted_at, posted_time, applications_count,
+                    apply_url, status::job_status
+                FROM unnest(
+                    $1::uuid[], $2::varchar[], $3::text[], $4::varchar[], $5::varchar[],
+                    $6::text[], $7::varchar[], $8::text[], $9::timestamptz[],
+                    $10::varchar[], $11::varchar[], $12::text[], $13::text[]
+                ) AS j(
+                    id, linkedin_id, url, title, company, company_url, location,
+                    description, posted_at, posted_time, applications_count,
+                    apply_url, status
+                )
+                ON CONFLICT (linkedin_id) DO NOTHING
+                RETURNING id, linkedin_id
+                """,
+                *map(list, columns),
+            )
+
+        return {row["linkedin_id"]: str(row["id"]) for row in rows}
+
     async def upsert_job(self, job: dict[str, Any]) -> tuple[str, bool]:
         """
         Upsert job by linkedin_id. Returns (job_id, was_inserted).
@@ -167,6 +224,17 @@ class Database:
             )
             return dict(row) if row else None
 
+    async def get_existing_linkedin_ids(self, linkedin_ids: list[str]) -> set[str]:
+        """Return the subset of LinkedIn IDs already stored as jobs."""
+        if not linkedin_ids:
+            return set()
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT linkedin_id FROM jobs WHERE linkedin_id = ANY($1::varchar[])",
+                linkedin_ids,
+            )
+            return {row["linkedin_id"] for row in rows}
+
     async def get_jobs_by_status(
         self, status: str, limit: int = 100
     ) -> list[dict[str, Any]]:
@@ -199,6 +267,18 @@ class Database:
             )
             return result == "UPDATE 1"
 
+    async def bulk_update_job_statuses(self, job_ids: list[str], status: str) -> int:
+        """Set the same status on many jobs in one statement. Returns rows updated."""
+        if not job_ids:
+            return 0
+        async with self.pool.acquire() as conn:
+            result = await conn.execute(
+                "UPDATE jobs SET status = $1, updated_at = NOW() WHERE id = ANY($2::uuid[])",
+                status,
+                [uuid.UUID(job_id) for job_id in job_ids],
+            )
+            return int(result.split()[-1])
+
     # -------------------------------------------------------------------------
     # Matcher Operations (LLM-based CV matching)
     # -------------------------------------------------------------------------
@@ -226,6 +306,31 @@ class Database:
             )
             return result == "UPDATE 1"
 
+    async def bulk_update_job_matches(self, matches: list[tuple[str, int, str]]) -> int:
+        """
+        Store many LLM match results in one statement.
+        Takes (job_id, llm_match_score, llm_match_reasoning) tuples; returns rows updated.
+        """
+        if not matches:
+            return 0
+        job_ids, scores, reasonings = zip(*matches)
+        async with self.pool.acquire() as conn:
+            result = await conn.execute(
+                """
+                UPDATE jobs SET
+                    llm_match_score = m.score,
+                    llm_match_reasoning = m.reasoning,
+                    matched_at = NOW(),
+                    updated_at = NOW()
+                FROM unnest($1::uuid[], $2::int[], $3::text[]) AS m(id, score, reasoning)
+                WHERE jobs.id = m.id
+                """,
+                [uuid.UUID(job_id) for job_id in job_ids],
+                list(scores),
+                list(reasonings),
+            )
+            return int(result.split()[-1])
+
     async def get_qualified_unmatched_jobs(
         self, limit: int = 50
     ) -> list[dict[str, Any]]:
@@ -297,6 +402,26 @@ class Database:
             )
             return result == "UPDATE 1"
 
+    async def bulk_update_job_generated(
+        self, job_ids: list[str], status: str = "generated"
+    ) -> int:
+        """Mark many jobs as generated in one statement. Returns rows updated."""
+        if not job_ids:
+            return 0
+        async with self.pool.acquire() as conn:
+            result = await conn.execute(
+                """
+                UPDATE jobs SET
+                    status = $1,
+                    generated_at = NOW(),
+                    updated_at = NOW()
+                WHERE id = ANY($2::uuid[])
+                """,
+                status,
+                [uuid.UUID(job_id) for job_id in job_ids],
+            )
+            return int(result.split()[-1])
+
     async def get_all_jobs(self, limit: int = 1000) -> list[dict[str, Any]]:
         """Get all jobs."""
         async with self.pool.acquire() as conn:
@@ -350,6 +475,44 @@ class Database:
 
         return app_id
 
+    async def bulk_insert_applications(
+        self, applications: list[dict[str, Any]]
+    ) -> list[str]:
+        """Insert many applications in one round-trip. Returns their IDs."""
+        if not applications:
+            return []
+
+        app_ids = [str(uuid.uuid4()) for _ in applications]
+        records = [
+            (
+                uuid.UUID(app_id),
+                uuid.UUID(application.get("job_id")),
+                application.get("job_title"),
+                application.get("company"),
+                application.get("resume_path"),
+                application.get("cover_letter_path"),
+                application.get("resume_content"),
+                application.get("cover_letter_content"),
+                application.get("status", "pending"),
+                application.get("notes"),
+            )
+            for app_id, application in zip(app_ids, applications)
+        ]
+
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(
+                    """
+                    INSERT INTO applications (
+                        id, job_id, job_title, company, resume_path, cover_letter_path,
+                        resume_content, cover_letter_content, status, notes
+                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+                    """,
+                    records,
+                )
+
+        return app_ids
+
     async def get_application(self, application_id: str) -> Optional[dict[str, Any]]:
         """Get application by ID."""
         async with self.pool.acquire() as conn:
@@ -368,6 +531,17 @@ class Database:
             )
             return [dict(row) for row in rows]
 
+    async def get_existing_application_job_ids(self, job_ids: list[str]) -> set[str]:
+        """Return the subset of job IDs that already have an application."""
+        if not job_ids:
+            return set()
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT DISTINCT job_id FROM applications WHERE job_id = ANY($1::uuid[])",
+                [uuid.UUID(job_id) for job_id in job_ids],
+            )
+            return {str(row["job_id"]) for row in rows}
+
     async def update_application_status(
         self, application_id: str, status: str, extra_fields: Optional[dict] = None
     ) -> bool:
@@ -380,6 +554,31 @@ class Database:
             )
             return result == "UPDATE 1"
 
+    # -------------------------------------------------------------------------
+    # LLM Output Cache
+    # -------------------------------------------------------------------------
+
+    async def get_cached_llm_output(self, cache_key: str) -> Optional[str]:
+        """Get cached LLM output by its input hash."""
+        async with self.pool.acquire() as conn:
+            return await conn.fetchval(
+                "SELECT content FROM llm_output_cache WHERE cache_key = $1",
+                cache_key,
+            )
+
+    async def set_cached_llm_output(self, cache_key: str, content: str) -> None:
+        """Store LLM output under its input hash."""
+        async with self.pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO llm_output_cache (cache_key, content)
+                VALUES ($1, $2)
+                ON CONFLICT (cache_key) DO NOTHING
+                """,
+                cache_key,
+                content,
+            )
+
     # -------------------------------------------------------------------------
     # Index Setup (no-op for PostgreSQL - indexes are in migration)
     # -------------------------------------------------------------------------
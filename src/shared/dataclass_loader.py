@@ -0,0 +1,18 @@
+"""
+Build dataclasses from loosely shaped YAML mappings.
+Unknown keys are ignored and missing keys keep the field default.
+"""
+
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def from_dict[T](cls: type[T], data: dict[str, Any]) -> T:
+    """Build a dataclass from a YAML mapping; missing keys keep the field default."""
+    return cls(**{name: data[name] for name in _field_names(cls) if name in data})
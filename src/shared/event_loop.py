@@ -0,0 +1,17 @@
+"""
+Event loop runner for service entry points.
+Uses uvloop (libuv-based, faster socket I/O) when installed.
+"""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+try:
+    import uvloop
+except ImportError:  # optional; unavailable on Windows
+    uvloop = None
+
+def run[T](main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion like asyncio.run, on uvloop if available."""
+    return asyncio.run(main, loop_factory=uvloop.new_event_loop if uvloop else None)
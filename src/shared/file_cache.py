@@ -0,0 +1,47 @@
+"""
+Pickle sidecar cache for objects built from a source file.
+Entries are keyed by the file's path, modification time and size, so
+editing the file invalidates them.
+"""
+
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+from loguru import logger
+
+
+def _sidecar_path(path: Path) -> Path:
+    return path.with_suffix(path.suffix + ".cache.pkl")
+
+
+def source_key(path: Path, version: int = 1) -> str:
+    """Cache key for the current state of path; bump version when the cached type changes."""
+    st = path.stat()
+    return f"{version}:{path.resolve()}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def load_cached(path: Path, key: str) -> Optional[Any]:
+    """Return the object cached for path under key, or None on a miss."""
+    try:
+        header, payload = _sidecar_path(path).read_bytes().split(b"\n", 1)
+        if header.decode("utf-8") == key:
+            return pickle.loads(payload)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable cache for {path}: {e}")
+    return None
+
+
+def store_cached(path: Path, key: str, obj: Any) -> None:
+    """Cache obj for path under key. Best effort: the directory may be read-only."""
+    cache_path = _sidecar_path(path)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(key.encode("utf-8") + b"\n" + pickle.dumps(obj, protocol=5))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write cache {cache_path}: {e}")
+        tmp_path.unlink(missing_ok=True)
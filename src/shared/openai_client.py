@@ -0,0 +1,56 @@
+"""
+Shared OpenAI client.
+All LLM callers in a process reuse one keepalive connection pool per API key.
+"""
+
+from importlib.util import find_spec
+
+import httpx
+from openai import AsyncOpenAI
+
+# Sized for bursts of concurrent completions across jobs; httpx defaults to 20 keepalive
+MAX_CONNECTIONS = 256
+MAX_KEEPALIVE_CONNECTIONS = 64
+
+# 429/5xx/timeouts are retried by the SDK with jittered exponential backoff (honoring
+# Retry-After); concurrent batches hit rate limits more often than its default 2 retries cover
+MAX_RETRIES = 5
+
+_clients: dict[str, AsyncOpenAI] = {}
+
+
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    """Get the process-wide OpenAI client for an API key."""
+    client = _clients.get(api_key)
+    if client is None:
+        client = _clients[api_key] = _create_client(api_key)
+    return client
+
+
+def _create_client(api_key: str) -> AsyncOpenAI:
+    """Build an OpenAI client with a pool tuned for concurrent requests."""
+    return AsyncOpenAI(
+        api_key=api_key,
+        max_retries=MAX_RETRIES,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=MAX_CONNECTIONS,
+            ),
+            # The SDK's default: fail fast on dead sockets (5s connect), but give long
+            # non-streaming completions the full 600s read timeout
+            timeout=httpx.Timeout(600.0, connect=5.0),
+            # HTTP/2 needs the optional h2 package
+            http2=find_spec("h2") is not None,
+        ),
+    )
+
+
+async def close_openai_clients() -> None:
+    """Close every shared client and its connection pool."""
+    # Pooled connections belong to the event loop that opened them, so
+    # each asyncio.run() closes its clients and the next one starts fresh
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.close()
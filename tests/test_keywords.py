@@ -0,0 +1,145 @@
+"""
+Keyword matching must agree with the simple loops it replaced, or CV
+selection, CV tailoring and job ranking change silently.
+"""
+
+import random
+import re
+import types
+
+import pytest
+
+from generator.keywords import KeywordMatcher
+from ranker import templates
+from ranker.templates import KeywordSet
+
+
+def substring_count(text: str, keywords: list[str]) -> int:
+    """Reference: the per-keyword `in` loop KeywordMatcher replaced."""
+    if not text:
+        return 0
+    text_lower = text.lower()
+    return sum(1 for kw in keywords if kw.lower() in text_lower)
+
+
+@pytest.mark.parametrize(
+    ("keywords", "text", "expected"),
+    [
+        # Nested: a keyword inside a longer one
+        (["security", "cyber security"], "Cyber Security lead", 2),
+        # Prefix: both keywords start at the same position
+        (["go", "golang"], "Golang developer", 2),
+        (["security", "security engineer"], "Security Engineering", 2),
+        (["security", "security engineer"], "Security Analyst", 1),
+        # Overlapping occurrences
+        (["aba", "bab"], "abab", 2),
+        # Duplicate keywords count once each, repeated occurrences do not
+        (["Python", "python", "PYTHON"], "python and python", 3),
+        # Non-word edges and regex metacharacters
+        (["c++", ".net", "c#", "node.js"], "C++ and ASP.NET, no nodexjs", 2),
+        (["a.b"], "axb", 0),
+        (["kubernetes"], "", 0),
+    ],
+)
+def test_keyword_matcher_count(keywords, text, expected):
+    assert substring_count(text, keywords) == expected
+    assert KeywordMatcher(keywords).count(text) == expected
+
+
+def test_keyword_matcher_find_returns_lowercased_keywords():
+    matcher = KeywordMatcher(["Cyber Security", "Security", "SIEM"])
+    assert matcher.find("cyber security team") == {"cyber security", "security"}
+
+
+def test_keyword_matcher_agrees_with_substring_loop():
+    rng = random.Random(0)
+    alphabet = "ab+. c"
+    for _ in range(500):
+        keywords = [
+            "".join(rng.choices(alphabet, k=rng.randint(1, 4))) for _ in range(rng.randint(1, 6))
+        ]
+        text = "".join(rng.choices(alphabet, k=rng.randint(0, 30)))
+        assert KeywordMatcher(keywords).count(text) == substring_count(text, keywords), (
+            keywords,
+            text,
+        )
+
+
+def boundary_find(text_lower: str, keywords: list[str]) -> list[str]:
+    """Reference: the per-keyword \\b regex loop KeywordSet replaced."""
+    return [
+        kw
+        for kw in keywords
+        if re.search(r"\b" + re.escape(kw.lower().strip()) + r"\b", text_lower)
+    ]
+
+
+class NaiveAutomaton:
+    """Stand-in for ahocorasick.Automaton: reports (end_index, value) for every occurrence."""
+
+    def __init__(self):
+        self.words: dict[str, str] = {}
+
+    def add_word(self, word: str, value: str) -> None:
+        self.words[word] = value
+
+    def make_automaton(self) -> None:
+        pass
+
+    def iter(self, text: str):
+        for start in range(len(text)):
+            for word, value in self.words.items():
+                if text.startswith(word, start):
+                    yield start + len(word) - 1, value
+
+
+@pytest.fixture(params=["regex", "automaton"])
+def keyword_set(request, monkeypatch):
+    """Build KeywordSets with the regex fallback or the automaton path."""
+    if request.param == "regex":
+        monkeypatch.setattr(templates, "ahocorasick", None)
+    elif templates.ahocorasick is None:
+        monkeypatch.setattr(
+            templates, "ahocorasick", types.SimpleNamespace(Automaton=NaiveAutomaton)
+        )
+    return KeywordSet
+
+
+@pytest.mark.parametrize(
+    ("keywords", "text", "expected"),
+    [
+        # Nested: a keyword inside a longer one
+        (["security", "cyber security"], "cyber security lead", ["security", "cyber security"]),
+        # Prefix: only whole words count
+        (["security", "security engineer"], "security engineer", ["security", "security engineer"]),
+        (["security", "security engineer"], "security engineering", ["security"]),
+        (["go", "golang"], "golang developer", ["golang"]),
+        (["soc", "soc analyst"], "socket programming", []),
+        # Duplicates are all reported, in keyword order
+        (["SOC", "Python", "soc", " soc "], "soc and python", ["SOC", "Python", "soc", " soc "]),
+        # Non-word edges: \b needs a word character on the other side
+        (["c++", ".net"], "c++ and .net", []),
+        (["c++", ".net"], "c++x and asp.net", ["c++", ".net"]),
+        (["remote"], "(remote)", ["remote"]),
+        (["kubernetes"], "", []),
+    ],
+)
+def test_keyword_set_find(keyword_set, keywords, text, expected):
+    assert boundary_find(text, keywords) == expected
+    assert keyword_set(keywords).find(text) == expected
+
+
+def test_keyword_set_agrees_with_boundary_loop(keyword_set):
+    rng = random.Random(0)
+    alphabet = "ab+. _"
+    for _ in range(500):
+        keywords = [
+            "".join(rng.choices(alphabet, k=rng.randint(1, 4))) for _ in range(rng.randint(1, 6))
+        ]
+        # Blank keywords are never matched, unlike the old loop
+        keywords = [kw for kw in keywords if kw.strip()]
+        text = "".join(rng.choices(alphabet, k=rng.randint(0, 30)))
+        assert keyword_set(keywords).find(text) == boundary_find(text, keywords), (
+            keywords,
+            text,
+        )